@@ -1,8 +1,27 @@
+import functools
 import importlib.metadata
+from typing import TYPE_CHECKING
 
-from ._a2a import KAgentApp
 from .types import AgentConfig
 
-__version__ = importlib.metadata.version("kagent_adk")
+if TYPE_CHECKING:
+    from ._a2a import KAgentApp
 
 __all__ = ["KAgentApp", "AgentConfig"]
+
+
+@functools.cache
+def _get_version() -> str:
+    return importlib.metadata.version("kagent_adk")
+
+
+def __getattr__(name: str):
+    # KAgentApp pulls in the A2A server, FastAPI and the ADK runner; import it
+    # on first access so that consumers that only need AgentConfig stay light.
+    if name == "KAgentApp":
+        from ._a2a import KAgentApp
+
+        return KAgentApp
+    if name == "__version__":
+        return _get_version()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
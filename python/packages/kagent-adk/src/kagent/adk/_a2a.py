@@ -2,6 +2,7 @@
 import faulthandler
 import logging
 import os
+from contextlib import asynccontextmanager
 from typing import Any, Callable, List, Optional
 
 import httpx
@@ -10,16 +11,15 @@ from a2a.server.request_handlers import DefaultRequestHandler
 from a2a.server.tasks import InMemoryTaskStore
 from a2a.types import AgentCard
 from agentsts.adk import ADKSTSIntegration, ADKTokenPropagationPlugin
-from fastapi import FastAPI, Request
-from fastapi.responses import PlainTextResponse
+from fastapi import FastAPI
 from google.adk.agents import BaseAgent
 from google.adk.apps import App, ResumabilityConfig
 from google.adk.apps.app import EventsCompactionConfig
 from google.adk.artifacts import InMemoryArtifactService
 from google.adk.plugins import BasePlugin
 from google.adk.runners import Runner
-from google.adk.sessions import InMemorySessionService
 from google.genai import types
+from kagent.core import add_health_routes
 from kagent.core.a2a import (
     KAgentRequestContextBuilder,
     KAgentTaskStore,
@@ -27,29 +27,44 @@ from kagent.core.a2a import (
 )
 
 from ._agent_executor import A2aAgentExecutor, A2aAgentExecutorConfig
-from ._lifespan import LifespanManager
+from ._lifespan import LifespanManager, loop_monitor_lifespan
 from ._memory_service import KagentMemoryService
-from ._session_service import KAgentSessionService
+from ._session_service import BoundedInMemorySessionService, KAgentSessionService
 from ._token import KAgentTokenService
-from .types import AgentConfig
+from .types import AgentConfig, build_adk_context_configs
 
 logger = logging.getLogger(__name__)
 
+kagent_url_override = os.getenv("KAGENT_URL")
 
-def health_check(request: Request) -> PlainTextResponse:
-    return PlainTextResponse("OK")
+# Session, task and memory calls to the KAgent backend all go through one
+# client per app; keep enough idle connections to serve concurrent A2A
+# requests without reconnecting.
+_KAGENT_HTTP_LIMITS = httpx.Limits(max_connections=200, max_keepalive_connections=100, keepalive_expiry=30.0)
 
 
-def thread_dump(request: Request) -> PlainTextResponse:
-    import tempfile
+def _http_client_lifespan(create_client: Callable[[], httpx.AsyncClient], consumers: List[Any]):
+    """Returns an async context manager that owns the KAgent backend client.
 
-    with tempfile.TemporaryFile(mode="w+") as tmp:
-        faulthandler.dump_traceback(file=tmp, all_threads=True)
-        tmp.seek(0)
-        return PlainTextResponse(tmp.read())
+    Every startup creates a fresh client, binds it to the ``client`` attribute
+    of each consumer and closes it on shutdown, so an app can go through
+    several lifespans without reusing a closed client.
+    """
 
+    @asynccontextmanager
+    async def _lifespan(app: Any):
+        http_client = create_client()
+        for consumer in consumers:
+            previous = consumer.client
+            consumer.client = http_client
+            if previous is not http_client and not previous.is_closed:
+                await previous.aclose()
+        try:
+            yield
+        finally:
+            await http_client.aclose()
 
-kagent_url_override = os.getenv("KAGENT_URL")
+    return _lifespan
 
 
 class KAgentApp:
@@ -78,26 +93,51 @@ class KAgentApp:
         """
         self.root_agent_factory = root_agent_factory
         self.kagent_url = kagent_url
+        # KAGENT_URL, when set, takes precedence over the configured backend URL.
+        self._base_url = kagent_url_override or kagent_url
         self.app_name = app_name
         self.agent_card = agent_card
         self._lifespan = lifespan
         self.plugins = plugins if plugins is not None else []
         self.stream = stream
         self.agent_config = agent_config
+        self._builds: dict[bool, FastAPI] = {}
 
     def build(self, local=False) -> FastAPI:
-        session_service = InMemorySessionService()
+        """Build the FastAPI application serving the agent over A2A.
+
+        The application is built once per value of ``local`` and reused on
+        subsequent calls.
+
+        Args:
+            local: Use in-memory session and task stores instead of the KAgent backend
+        """
+        app = self._builds.get(local)
+        if app is None:
+            app = self._builds[local] = self._build_app(local)
+        return app
+
+    def _build_app(self, local: bool) -> FastAPI:
+        session_service: BoundedInMemorySessionService | KAgentSessionService = BoundedInMemorySessionService()
         token_service = None
         http_client: Optional[httpx.AsyncClient] = None
+        http_client_consumers: List[Any] = []
         memory_service = None
 
         if not local:
             token_service = KAgentTokenService(self.app_name)
-            http_client = httpx.AsyncClient(
-                # TODO: add user  and agent headers
-                base_url=kagent_url_override or self.kagent_url,
-                event_hooks=token_service.event_hooks(),
-            )
+
+            def create_http_client() -> httpx.AsyncClient:
+                return httpx.AsyncClient(
+                    # TODO: add user  and agent headers
+                    base_url=self._base_url,
+                    event_hooks=token_service.event_hooks(),
+                    limits=_KAGENT_HTTP_LIMITS,
+                )
+
+            # The lifespan replaces this client with its own on startup; it is
+            # only used if requests are served without running the lifespan.
+            http_client = create_http_client()
             session_service = KAgentSessionService(http_client)
 
             if self.agent_config and self.agent_config.memory is not None:
@@ -107,23 +147,28 @@ class KAgentApp:
                     embedding_config=self.agent_config.memory.embedding,
                     ttl_days=self.agent_config.memory.ttl_days,
                 )
+                http_client_consumers.append(memory_service)
+            http_client_consumers.append(session_service)
+
+        # Build ADK context config objects from agent config once; they only
+        # depend on the agent config, and the compaction summarizer wraps an LLM
+        # client that is expensive to recreate for every request.
+        events_compaction_config: EventsCompactionConfig | None = None
+        if self.agent_config and self.agent_config.context_config is not None:
+            events_compaction_config, _ = build_adk_context_configs(self.agent_config.context_config)
+        resumability_config = ResumabilityConfig(is_resumable=True)
 
         def create_runner() -> Runner:
+            # The agent and its toolsets are created per request: the executor
+            # closes the runner, and with it the toolsets, once the request ends.
             root_agent = self.root_agent_factory()
 
-            # Build ADK context config objects from agent config
-            events_compaction_config: EventsCompactionConfig | None = None
-            if self.agent_config and self.agent_config.context_config is not None:
-                from .types import build_adk_context_configs
-
-                events_compaction_config, _ = build_adk_context_configs(self.agent_config.context_config)
-
             adk_app = App(
                 name=self.app_name,
                 root_agent=root_agent,
                 plugins=self.plugins,
                 events_compaction_config=events_compaction_config,
-                resumability_config=ResumabilityConfig(is_resumable=True),
+                resumability_config=resumability_config,
             )
 
             return Runner(
@@ -136,6 +181,7 @@ class KAgentApp:
         task_store: InMemoryTaskStore | KAgentTaskStore = InMemoryTaskStore()
         if not local and http_client is not None:
             task_store = KAgentTaskStore(http_client)
+            http_client_consumers.append(task_store)
 
         agent_executor = A2aAgentExecutor(
             runner=create_runner,
@@ -160,21 +206,24 @@ class KAgentApp:
         faulthandler.enable()
 
         lifespan_manager = LifespanManager()
+        lifespan_manager.add(loop_monitor_lifespan())
         lifespan_manager.add(self._lifespan)
         if not local:
             lifespan_manager.add(token_service.lifespan())
+            lifespan_manager.add(_http_client_lifespan(create_http_client, http_client_consumers))
+        else:
+            lifespan_manager.add(session_service.lifespan())
 
         app = FastAPI(lifespan=lifespan_manager)
 
         # Health check/readiness probe
-        app.add_route("/health", methods=["GET"], route=health_check)
-        app.add_route("/thread_dump", methods=["GET"], route=thread_dump)
+        add_health_routes(app)
         a2a_app.add_routes_to_app(app)
 
         return app
 
     async def test(self, task: str):
-        session_service = InMemorySessionService()
+        session_service = BoundedInMemorySessionService()
         SESSION_ID = "12345"
         USER_ID = "admin"
         await session_service.create_session(
@@ -206,5 +255,5 @@ class KAgentApp:
             # print(f"  [Event] Author: {event.author}, Type: {type(event).__name__}, Final: {event.is_final_response()}, Content: {event.content}")
 
             # Key Concept: is_final_response() marks the concluding message for the turn.
-            jsn = event.model_dump_json()
-            logger.info(f"  [Event] {jsn}")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("  [Event] %s", event.model_dump_json())
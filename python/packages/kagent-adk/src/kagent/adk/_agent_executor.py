@@ -3,6 +3,7 @@ from __future__ import annotations
 import asyncio
 import inspect
 import logging
+import re
 import uuid
 from contextlib import suppress
 from datetime import datetime, timezone
@@ -21,6 +22,7 @@ from a2a.types import (
     TaskStatusUpdateEvent,
     TextPart,
 )
+from google.adk.a2a.converters.request_converter import AgentRunRequest
 from google.adk.a2a.executor.a2a_agent_executor import (
     A2aAgentExecutor as UpstreamA2aAgentExecutor,
 )
@@ -46,6 +48,7 @@ from kagent.core.a2a import (
 )
 from kagent.core.tracing._span_processor import (
     clear_kagent_span_attributes,
+    kagent_span_attributes_enabled,
     set_kagent_span_attributes,
 )
 from pydantic import BaseModel
@@ -59,6 +62,24 @@ from .converters.request_converter import convert_a2a_request_to_adk_run_args
 
 logger = logging.getLogger("kagent_adk." + __name__)
 
+# A2A event metadata keys for the run, stamped onto the working and final events.
+_APP_NAME_METADATA_KEY = get_kagent_metadata_key("app_name")
+_USER_ID_METADATA_KEY = get_kagent_metadata_key("user_id")
+_SESSION_ID_METADATA_KEY = get_kagent_metadata_key("session_id")
+_INVOCATION_ID_METADATA_KEY = get_kagent_metadata_key("invocation_id")
+_USAGE_METADATA_METADATA_KEY = get_kagent_metadata_key("usage_metadata")
+
+# LiteLLM JSON parsing errors, common with Ollama models that don't support function calling.
+_MODEL_JSON_ERROR_RE = re.compile(r"JSONDecodeError|Unterminated string|APIConnectionError")
+_FUNCTION_CALLING_ERROR_RE = re.compile(r"(?i:function_call)|json\.loads")
+_FUNCTION_CALLING_UNSUPPORTED_MESSAGE = (
+    "The model does not support function calling properly. "
+    "This error typically occurs when using Ollama models with tools. "
+    "Please either:\n"
+    "1. Remove tools from the agent configuration, or\n"
+    "2. Use a model that supports function calling (e.g., OpenAI, Anthropic, or Gemini models)."
+)
+
 
 class A2aAgentExecutorConfig(BaseModel):
     """Configuration for the KAgent A2aAgentExecutor."""
@@ -66,6 +87,11 @@ class A2aAgentExecutorConfig(BaseModel):
     stream: bool = False
 
 
+def _utcnow_iso() -> str:
+    """Timestamp for A2A task status updates."""
+    return datetime.now(timezone.utc).isoformat()
+
+
 def _kagent_request_converter(request, _part_converter=None):
     """Adapter to match the upstream A2ARequestToAgentRunRequestConverter signature.
 
@@ -73,8 +99,6 @@ def _kagent_request_converter(request, _part_converter=None):
     Kagent's converter has a different signature, so this wraps it to satisfy
     the upstream config type while still using kagent's own conversion logic.
     """
-    from google.adk.a2a.converters.request_converter import AgentRunRequest
-
     run_args = convert_a2a_request_to_adk_run_args(request, stream=False)
     return AgentRunRequest(
         user_id=run_args["user_id"],
@@ -211,28 +235,31 @@ class A2aAgentExecutor(UpstreamA2aAgentExecutor):
         stream = self._kagent_config.stream if self._kagent_config is not None else False
         run_args = convert_a2a_request_to_adk_run_args(context, stream=stream)
 
-        # Prepare span attributes.
-        span_attributes = {}
-        if run_args.get("user_id"):
-            span_attributes["kagent.user_id"] = run_args["user_id"]
-        if context.task_id:
-            span_attributes["gen_ai.task.id"] = context.task_id
-        if run_args.get("session_id"):
-            span_attributes["gen_ai.conversation.id"] = run_args["session_id"]
-
-        # Set kagent span attributes for all spans in context.
-        context_token = set_kagent_span_attributes(span_attributes)
+        context_token = None
+        if kagent_span_attributes_enabled():
+            # Prepare span attributes.
+            span_attributes = {}
+            if run_args.get("user_id"):
+                span_attributes["kagent.user_id"] = run_args["user_id"]
+            if context.task_id:
+                span_attributes["gen_ai.task.id"] = context.task_id
+            if run_args.get("session_id"):
+                span_attributes["gen_ai.conversation.id"] = run_args["session_id"]
+
+            # Set kagent span attributes for all spans in context.
+            context_token = set_kagent_span_attributes(span_attributes)
         runner: Optional[Runner] = None
         try:
             # for new task, create a task submitted event
+            # (events built here from already-typed values skip validation via model_construct)
             if not context.current_task:
                 await event_queue.enqueue_event(
-                    TaskStatusUpdateEvent(
+                    TaskStatusUpdateEvent.model_construct(
                         task_id=context.task_id,
-                        status=TaskStatus(
+                        status=TaskStatus.model_construct(
                             state=TaskState.submitted,
                             message=context.message,
-                            timestamp=datetime.now(timezone.utc).isoformat(),
+                            timestamp=_utcnow_iso(),
                         ),
                         context_id=context.context_id,
                         final=False,
@@ -250,26 +277,15 @@ class A2aAgentExecutor(UpstreamA2aAgentExecutor):
             except Exception as e:
                 logger.error("Error handling A2A request: %s", e, exc_info=True)
 
-                # Check if this is a LiteLLM JSON parsing error (common with Ollama models that don't support function calling)
+                # Check if this is a LiteLLM JSON parsing error related to function calling
                 error_message = str(e)
-                if (
-                    "JSONDecodeError" in error_message
-                    or "Unterminated string" in error_message
-                    or "APIConnectionError" in error_message
-                ):
-                    # Check if it's related to function calling
-                    if "function_call" in error_message.lower() or "json.loads" in error_message:
-                        error_message = (
-                            "The model does not support function calling properly. "
-                            "This error typically occurs when using Ollama models with tools. "
-                            "Please either:\n"
-                            "1. Remove tools from the agent configuration, or\n"
-                            "2. Use a model that supports function calling (e.g., OpenAI, Anthropic, or Gemini models)."
-                        )
+                if _MODEL_JSON_ERROR_RE.search(error_message) and _FUNCTION_CALLING_ERROR_RE.search(error_message):
+                    error_message = _FUNCTION_CALLING_UNSUPPORTED_MESSAGE
                 # Publish failure event
                 await self._publish_failed_status_event(context, event_queue, error_message)
         finally:
-            clear_kagent_span_attributes(context_token)
+            if context_token is not None:
+                clear_kagent_span_attributes(context_token)
             # close the runner which cleans up the mcptoolsets
             # since the runner is created for each a2a request
             # and the mcptoolsets are not shared between requests
@@ -324,15 +340,15 @@ class A2aAgentExecutor(UpstreamA2aAgentExecutor):
     ) -> None:
         try:
             await event_queue.enqueue_event(
-                TaskStatusUpdateEvent(
+                TaskStatusUpdateEvent.model_construct(
                     task_id=context.task_id,
-                    status=TaskStatus(
+                    status=TaskStatus.model_construct(
                         state=TaskState.failed,
-                        timestamp=datetime.now(timezone.utc).isoformat(),
-                        message=Message(
-                            message_id=str(uuid.uuid4()),
+                        timestamp=_utcnow_iso(),
+                        message=Message.model_construct(
+                            message_id=uuid.uuid4().hex,
                             role=Role.agent,
-                            parts=[Part(TextPart(text=error_message))],
+                            parts=[Part.model_construct(root=TextPart.model_construct(text=error_message))],
                         ),
                     ),
                     context_id=context.context_id,
@@ -538,20 +554,30 @@ class A2aAgentExecutor(UpstreamA2aAgentExecutor):
                 run_args["new_message"] = genai_types.Content(role="user", parts=parts)
             # Fall through to normal execution with the constructed FunctionResponse
         else:
-            # Normal flow: set request headers to session state
+            # Normal flow: set request headers to session state. Session state is
+            # rebuilt from its events, so the update is only recorded (and, with
+            # the kagent session service, persisted) when the headers changed; a
+            # missing entry reads as no headers, so header-less requests add nothing.
+            # Skipping relies on the runner loading the full event history. When
+            # the run config limits the events it loads (num_recent_events or
+            # after_timestamp), the earlier header event can fall outside that
+            # window, so the headers are recorded on every request instead.
             headers = context.call_context.state.get("headers", {})
-            state_changes = {
-                "headers": headers,
-            }
-
-            actions_with_update = EventActions(state_delta=state_changes)
-            system_event = Event(
-                invocation_id="header_update",
-                author="system",
-                actions=actions_with_update,
-            )
+            run_config = run_args["run_config"]
+            loads_all_events = run_config is None or run_config.get_session_config is None
+            if not loads_all_events or session.state.get("headers", {}) != headers:
+                state_changes = {
+                    "headers": headers,
+                }
+
+                actions_with_update = EventActions(state_delta=state_changes)
+                system_event = Event(
+                    invocation_id="header_update",
+                    author="system",
+                    actions=actions_with_update,
+                )
 
-            await runner.session_service.append_event(session, system_event)
+                await runner.session_service.append_event(session, system_event)
 
         # create invocation context
         invocation_context = runner._new_invocation_context(
@@ -562,21 +588,23 @@ class A2aAgentExecutor(UpstreamA2aAgentExecutor):
 
         # Base metadata for events (invocation_id will be updated once we see it from ADK)
         run_metadata = {
-            get_kagent_metadata_key("app_name"): runner.app_name,
-            get_kagent_metadata_key("user_id"): run_args["user_id"],
-            get_kagent_metadata_key("session_id"): run_args["session_id"],
+            _APP_NAME_METADATA_KEY: runner.app_name,
+            _USER_ID_METADATA_KEY: run_args["user_id"],
+            _SESSION_ID_METADATA_KEY: run_args["session_id"],
         }
 
         # publish the task working event
         await event_queue.enqueue_event(
-            TaskStatusUpdateEvent(
+            TaskStatusUpdateEvent.model_construct(
                 task_id=context.task_id,
-                status=TaskStatus(
+                status=TaskStatus.model_construct(
                     state=TaskState.working,
-                    timestamp=datetime.now(timezone.utc).isoformat(),
+                    timestamp=_utcnow_iso(),
                 ),
                 context_id=context.context_id,
                 final=False,
+                # Copied: run_metadata gains invocation_id and usage
+                # later, which belong only on the final event.
                 metadata=run_metadata.copy(),
             )
         )
@@ -595,41 +623,46 @@ class A2aAgentExecutor(UpstreamA2aAgentExecutor):
                 subagent_session_ids[tool.name] = tool.subagent_session_id
 
         task_result_aggregator = TaskResultAggregator()
+        # Loop-invariant lookups for the per-event pump below.
+        task_id = context.task_id
+        context_id = context.context_id
+        subagent_session_ids_or_none = subagent_session_ids or None
+        process_event = task_result_aggregator.process_event
+        enqueue_event = event_queue.enqueue_event
         async with Aclosing(runner.run_async(**run_args)) as agen:
             async for adk_event in agen:
                 # Capture the real invocation_id from the first ADK event that has one
-                event_inv_id = getattr(adk_event, "invocation_id", None)
-                if event_inv_id and not real_invocation_id:
-                    real_invocation_id = event_inv_id
-                    run_metadata[get_kagent_metadata_key("invocation_id")] = real_invocation_id
+                if real_invocation_id is None and adk_event.invocation_id:
+                    real_invocation_id = adk_event.invocation_id
+                    run_metadata[_INVOCATION_ID_METADATA_KEY] = real_invocation_id
 
                 # Track the last usage_metadata so it can be included in the final
                 # event's run_metadata. The A2A task_manager merges run_metadata into
                 # task.metadata, making it available to callers (e.g. KAgentRemoteA2ATool).
-                if getattr(adk_event, "usage_metadata", None) is not None:
+                if adk_event.usage_metadata is not None:
                     last_usage_metadata = adk_event.usage_metadata
 
                 for a2a_event in convert_event_to_a2a_events(
                     adk_event,
                     invocation_context,
-                    context.task_id,
-                    context.context_id,
-                    subagent_session_ids=subagent_session_ids or None,
+                    task_id,
+                    context_id,
+                    subagent_session_ids=subagent_session_ids_or_none,
                 ):
                     # Only aggregate non-partial events to avoid duplicates from streaming chunks
                     # Partial events are sent to frontend for display but not accumulated
                     if not adk_event.partial:
-                        task_result_aggregator.process_event(a2a_event)
-                    await event_queue.enqueue_event(a2a_event)
+                        process_event(a2a_event)
+                    await enqueue_event(a2a_event)
 
                 # Break on confirmation events that use long running tools
-                if getattr(adk_event, "long_running_tool_ids", None):
+                if adk_event.long_running_tool_ids:
                     break
 
         # Attach the last LLM usage to run_metadata so the A2A task_manager
         # merges it into task.metadata on the completed Task object.
         if last_usage_metadata is not None:
-            run_metadata[get_kagent_metadata_key("usage_metadata")] = serialize_metadata_value(last_usage_metadata)
+            run_metadata[_USAGE_METADATA_METADATA_KEY] = serialize_metadata_value(last_usage_metadata)
 
         # publish the task result event - this is final
         if (
@@ -640,23 +673,23 @@ class A2aAgentExecutor(UpstreamA2aAgentExecutor):
             # if task is still working properly, publish the artifact update event as
             # the final result according to a2a protocol.
             await event_queue.enqueue_event(
-                TaskArtifactUpdateEvent(
+                TaskArtifactUpdateEvent.model_construct(
                     task_id=context.task_id,
                     last_chunk=True,
                     context_id=context.context_id,
-                    artifact=Artifact(
-                        artifact_id=str(uuid.uuid4()),
+                    artifact=Artifact.model_construct(
+                        artifact_id=uuid.uuid4().hex,
                         parts=task_result_aggregator.task_status_message.parts,
                     ),
                 )
             )
             # publish the final status update event
             await event_queue.enqueue_event(
-                TaskStatusUpdateEvent(
+                TaskStatusUpdateEvent.model_construct(
                     task_id=context.task_id,
-                    status=TaskStatus(
+                    status=TaskStatus.model_construct(
                         state=TaskState.completed,
-                        timestamp=datetime.now(timezone.utc).isoformat(),
+                        timestamp=_utcnow_iso(),
                     ),
                     context_id=context.context_id,
                     final=True,
@@ -665,11 +698,11 @@ class A2aAgentExecutor(UpstreamA2aAgentExecutor):
             )
         else:
             await event_queue.enqueue_event(
-                TaskStatusUpdateEvent(
+                TaskStatusUpdateEvent.model_construct(
                     task_id=context.task_id,
-                    status=TaskStatus(
+                    status=TaskStatus.model_construct(
                         state=task_result_aggregator.task_state,
-                        timestamp=datetime.now(timezone.utc).isoformat(),
+                        timestamp=_utcnow_iso(),
                         message=task_result_aggregator.task_status_message,
                     ),
                     context_id=context.context_id,
@@ -691,16 +724,19 @@ class A2aAgentExecutor(UpstreamA2aAgentExecutor):
         if session is None:
             # Extract session name from the first TextPart (like the UI does)
             session_name = None
-            if context.message and context.message.parts:
-                for part in context.message.parts:
-                    # A2A parts have a .root property that contains the actual part (TextPart, FilePart, etc.)
-                    if isinstance(part, Part):
-                        root_part = part.root
-                        if isinstance(root_part, TextPart) and root_part.text:
-                            # Take first 20 chars + "..." if longer (matching UI behavior)
-                            text = root_part.text.strip()
-                            session_name = text[:20] + ("..." if len(text) > 20 else "")
-                            break
+            # Message.parts are validated Parts whose .root holds the actual part (TextPart, FilePart, etc.)
+            first_text_part = next(
+                (
+                    part.root
+                    for part in (context.message.parts if context.message else None) or ()
+                    if isinstance(part.root, TextPart) and part.root.text
+                ),
+                None,
+            )
+            if first_text_part is not None:
+                # Take first 20 chars + "..." if longer (matching UI behavior)
+                text = first_text_part.text.strip()
+                session_name = text[:20] + ("..." if len(text) > 20 else "")
 
             state: dict[str, Any] = {"session_name": session_name}
             # Propagate source (e.g. "agent") so the session is tagged in the DB.
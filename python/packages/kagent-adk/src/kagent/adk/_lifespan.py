@@ -1,10 +1,23 @@
 """Lifespan manager for composing multiple FastAPI lifespans."""
 
-from contextlib import asynccontextmanager
+import asyncio
+import logging
+import math
+import os
+from contextlib import AsyncExitStack, asynccontextmanager, suppress
 from typing import AsyncIterator, Callable, List
 
 from fastapi import FastAPI
 
+logger = logging.getLogger(__name__)
+
+# Interval between event loop lag probes, and the lag above which it is reported.
+LOOP_LAG_PROBE_INTERVAL_S = 0.05
+LOOP_LAG_WARNING_THRESHOLD_S = 0.01
+
+SLOW_CALLBACK_ENV_VAR = "KAGENT_SLOW_CALLBACK_S"
+DEFAULT_SLOW_CALLBACK_S = 0.1
+
 
 class LifespanManager:
     """
@@ -22,15 +35,74 @@ class LifespanManager:
 
     @asynccontextmanager
     async def __call__(self, app: FastAPI) -> AsyncIterator[None]:
-        """Compose all lifespans into a single context manager."""
+        """Compose all lifespans into a single context manager.
+
+        Lifespans are entered in the order they were added and exited in reverse.
+        """
+        async with AsyncExitStack() as stack:
+            for lifespan in self._lifespans:
+                await stack.enter_async_context(lifespan(app))
+            yield
+
+
+async def _probe_loop_lag() -> None:
+    loop = asyncio.get_running_loop()
+    while True:
+        start = loop.time()
+        await asyncio.sleep(LOOP_LAG_PROBE_INTERVAL_S)
+        lag = loop.time() - start - LOOP_LAG_PROBE_INTERVAL_S
+        if lag > LOOP_LAG_WARNING_THRESHOLD_S:
+            logger.warning("Event loop lag: %.1fms", lag * 1000)
 
-        async def nested(index: int) -> AsyncIterator[None]:
-            if index >= len(self._lifespans):
-                yield
-            else:
-                async with self._lifespans[index](app):
-                    async for _ in nested(index + 1):
-                        yield
 
-        async for _ in nested(0):
+def _get_slow_callback_duration() -> float:
+    value = os.getenv(SLOW_CALLBACK_ENV_VAR)
+    if value is None:
+        return DEFAULT_SLOW_CALLBACK_S
+    try:
+        duration = float(value)
+    except ValueError:
+        duration = math.nan
+    if not math.isfinite(duration) or duration <= 0:
+        logger.warning(
+            "Invalid %s value: %s (must be a positive number of seconds), using default %s",
+            SLOW_CALLBACK_ENV_VAR,
+            value,
+            DEFAULT_SLOW_CALLBACK_S,
+        )
+        return DEFAULT_SLOW_CALLBACK_S
+    return duration
+
+
+def loop_monitor_lifespan():
+    """Returns a lifespan that reports event loop stalls when KAGENT_DEBUG=1.
+
+    While the app runs, a background task measures how late the loop wakes it
+    up and logs the lag. KAGENT_DEBUG=1 also puts the loop in full asyncio
+    debug mode, which logs callbacks slower than KAGENT_SLOW_CALLBACK_S
+    seconds (default 0.1) but adds its own overhead (coroutine origin
+    tracking, thread-safety checks, resource warnings), so it is meant for
+    troubleshooting rather than production. The previous debug settings are
+    restored on shutdown. Returns None, adding nothing to the app, when
+    KAGENT_DEBUG is not set.
+    """
+    if os.getenv("KAGENT_DEBUG") != "1":
+        return None
+
+    @asynccontextmanager
+    async def _lifespan(app: FastAPI) -> AsyncIterator[None]:
+        loop = asyncio.get_running_loop()
+        previous_debug, previous_slow_callback_duration = loop.get_debug(), loop.slow_callback_duration
+        loop.set_debug(True)
+        loop.slow_callback_duration = _get_slow_callback_duration()
+        probe = asyncio.create_task(_probe_loop_lag())
+        try:
             yield
+        finally:
+            probe.cancel()
+            with suppress(asyncio.CancelledError):
+                await probe
+            loop.set_debug(previous_debug)
+            loop.slow_callback_duration = previous_slow_callback_duration
+
+    return _lifespan
@@ -6,6 +6,7 @@ from typing import Any, Optional
 
 import httpx
 from google.adk.tools import BaseTool
+from google.adk.tools.base_toolset import ToolPredicate
 from google.adk.tools.mcp_tool.mcp_tool import McpTool
 from google.adk.tools.mcp_tool.mcp_toolset import McpToolset, ReadonlyContext
 from google.adk.tools.tool_context import ToolContext
@@ -126,9 +127,21 @@ class KAgentMcpToolset(McpToolset):
 
     This is particularly useful for explicitly catching and enriching failures that the base
     implementation may not catch and propagate without enough context.
+
+    The agent asks for its tools before every LLM call. Within one invocation the
+    listed tools are reused instead of calling list_tools on the MCP server again,
+    unless a predicate tool_filter makes the selection depend on the context.
     """
 
+    # (invocation_id, tools) from the last listing.
+    _tools_cache: Optional[tuple[str, list[BaseTool]]] = None
+
     async def get_tools(self, readonly_context: Optional[ReadonlyContext] = None) -> list[BaseTool]:
+        invocation_id = readonly_context.invocation_id if readonly_context is not None else None
+        cacheable = invocation_id is not None and not isinstance(self.tool_filter, ToolPredicate)
+        if cacheable and self._tools_cache is not None and self._tools_cache[0] == invocation_id:
+            return list(self._tools_cache[1])
+
         try:
             tools = await super().get_tools(readonly_context)
         except asyncio.CancelledError as error:
@@ -142,6 +155,10 @@ class KAgentMcpToolset(McpToolset):
                 wrapped_tools.append(ConnectionSafeMcpTool(tool))
             else:
                 wrapped_tools.append(tool)
+
+        if cacheable:
+            self._tools_cache = (invocation_id, wrapped_tools)
+            return list(wrapped_tools)
         return wrapped_tools
 
     async def close(self) -> None:
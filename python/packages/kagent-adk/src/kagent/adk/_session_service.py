@@ -1,18 +1,30 @@
+import asyncio
 import logging
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager, suppress
 from typing import Any, Optional
 
 import httpx
 from google.adk.events.event import Event
-from google.adk.sessions import Session
+from google.adk.sessions import InMemorySessionService, Session
 from google.adk.sessions.base_session_service import (
     BaseSessionService,
     GetSessionConfig,
     ListSessionsResponse,
 )
+from pydantic import TypeAdapter
 from typing_extensions import override
 
 logger = logging.getLogger("kagent." + __name__)
 
+# Validates a session's stored events in one pass instead of one call per event.
+_EVENT_LIST_ADAPTER = TypeAdapter(list[Event])
+# Encodes append_event request bodies; produces the same compact UTF-8 JSON as
+# httpx's json= encoder without escaping the serialized event through the stdlib.
+_EVENT_BODY_ADAPTER = TypeAdapter(dict[str, str])
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
 
 class KAgentSessionService(BaseSessionService):
     """A session service implementation that uses the Kagent API.
@@ -65,7 +77,9 @@ class KAgentSessionService(BaseSessionService):
         session_data = data["data"]
 
         # Convert to ADK Session format
-        return Session(id=session_data["id"], user_id=session_data["user_id"], state=state or {}, app_name=app_name)
+        return Session.model_construct(
+            id=session_data["id"], user_id=session_data["user_id"], state=state or {}, app_name=app_name
+        )
 
     @override
     async def get_session(
@@ -108,12 +122,14 @@ class KAgentSessionService(BaseSessionService):
 
             events_data = data["data"]["events"]
 
-            events: list[Event] = []
-            for event_data in events_data:
-                events.append(Event.model_validate_json(event_data["data"]))
+            # Each event is stored as a JSON document; splice them into a single
+            # JSON array so they are parsed and validated in one call.
+            events: list[Event] = _EVENT_LIST_ADAPTER.validate_json(
+                "[" + ",".join(event_data["data"] for event_data in events_data) + "]"
+            )
 
             # Convert to ADK Session format
-            session = Session(
+            session = Session.model_construct(
                 id=session_data["id"],
                 user_id=session_data["user_id"],
                 events=[],
@@ -140,12 +156,12 @@ class KAgentSessionService(BaseSessionService):
         sessions_data = data.get("data", [])
 
         # Convert to ADK Session format
-        sessions = []
-        for session_data in sessions_data:
-            session = Session(id=session_data["id"], user_id=session_data["user_id"], state={}, app_name=app_name)
-            sessions.append(session)
+        sessions = [
+            Session.model_construct(id=session_data["id"], user_id=session_data["user_id"], state={}, app_name=app_name)
+            for session_data in sessions_data
+        ]
 
-        return ListSessionsResponse(sessions=sessions)
+        return ListSessionsResponse.model_construct(sessions=sessions)
 
     def list_sessions_sync(self, *, app_name: str, user_id: str) -> ListSessionsResponse:
         raise NotImplementedError("not supported. use async")
@@ -170,7 +186,8 @@ class KAgentSessionService(BaseSessionService):
         # Make API call to append event to session
         response = await self.client.post(
             f"/api/sessions/{session.id}/events?user_id={session.user_id}",
-            json=event_data,
+            content=_EVENT_BODY_ADAPTER.dump_json(event_data),
+            headers=_JSON_HEADERS,
         )
         response.raise_for_status()
 
@@ -180,3 +197,122 @@ class KAgentSessionService(BaseSessionService):
         await super().append_event(session=session, event=event)
 
         return event
+
+
+class BoundedInMemorySessionService(InMemorySessionService):
+    """An in-memory session service that bounds the number of retained sessions.
+
+    Sessions are tracked in least-recently-used order. Creating a session beyond
+    ``max_sessions`` evicts the least recently used one, and sessions that have
+    not been accessed for ``ttl_seconds`` are dropped by :meth:`evict_expired`,
+    which the :meth:`lifespan` runs periodically.
+    """
+
+    def __init__(
+        self,
+        max_sessions: int = 10_000,
+        ttl_seconds: float = 6 * 60 * 60,
+        eviction_interval_seconds: float = 60.0,
+    ):
+        super().__init__()
+        self.max_sessions = max_sessions
+        self.ttl_seconds = ttl_seconds
+        self.eviction_interval_seconds = eviction_interval_seconds
+        # (app_name, user_id, session_id) -> monotonic time of last access
+        self._last_access: OrderedDict[tuple[str, str, str], float] = OrderedDict()
+
+    def _touch(self, app_name: str, user_id: str, session_id: str) -> None:
+        key = (app_name, user_id, session_id)
+        self._last_access[key] = time.monotonic()
+        self._last_access.move_to_end(key)
+
+    def _evict(self, app_name: str, user_id: str, session_id: str) -> None:
+        self._last_access.pop((app_name, user_id, session_id), None)
+        user_sessions = self.sessions.get(app_name, {}).get(user_id)
+        if user_sessions is None:
+            return
+        user_sessions.pop(session_id, None)
+        if not user_sessions:
+            del self.sessions[app_name][user_id]
+
+    @override
+    async def create_session(
+        self,
+        *,
+        app_name: str,
+        user_id: str,
+        state: Optional[dict[str, Any]] = None,
+        session_id: Optional[str] = None,
+    ) -> Session:
+        session = await super().create_session(app_name=app_name, user_id=user_id, state=state, session_id=session_id)
+        self._touch(app_name, user_id, session.id)
+        while len(self._last_access) > self.max_sessions:
+            oldest = next(iter(self._last_access))
+            logger.debug("Evicting least recently used session %s", oldest[2])
+            self._evict(*oldest)
+        return session
+
+    @override
+    async def get_session(
+        self,
+        *,
+        app_name: str,
+        user_id: str,
+        session_id: str,
+        config: Optional[GetSessionConfig] = None,
+    ) -> Optional[Session]:
+        session = await super().get_session(app_name=app_name, user_id=user_id, session_id=session_id, config=config)
+        if session is not None:
+            self._touch(app_name, user_id, session_id)
+        return session
+
+    @override
+    async def delete_session(self, *, app_name: str, user_id: str, session_id: str) -> None:
+        await super().delete_session(app_name=app_name, user_id=user_id, session_id=session_id)
+        self._last_access.pop((app_name, user_id, session_id), None)
+
+    @override
+    async def append_event(self, session: Session, event: Event) -> Event:
+        event = await super().append_event(session=session, event=event)
+        key = (session.app_name, session.user_id, session.id)
+        if key in self._last_access:
+            self._touch(*key)
+        return event
+
+    def evict_expired(self) -> int:
+        """Drops sessions that have been idle for longer than ``ttl_seconds``.
+
+        Returns:
+            The number of evicted sessions.
+        """
+        deadline = time.monotonic() - self.ttl_seconds
+        expired = []
+        for key, last_access in self._last_access.items():
+            if last_access > deadline:
+                break
+            expired.append(key)
+        for key in expired:
+            self._evict(*key)
+        return len(expired)
+
+    def lifespan(self):
+        """Returns an async context manager that periodically evicts idle sessions."""
+
+        async def _evict_loop() -> None:
+            while True:
+                await asyncio.sleep(self.eviction_interval_seconds)
+                evicted = self.evict_expired()
+                if evicted:
+                    logger.debug("Evicted %d idle sessions", evicted)
+
+        @asynccontextmanager
+        async def _lifespan(app: Any):
+            task = asyncio.create_task(_evict_loop())
+            try:
+                yield
+            finally:
+                task.cancel()
+                with suppress(asyncio.CancelledError):
+                    await task
+
+        return _lifespan
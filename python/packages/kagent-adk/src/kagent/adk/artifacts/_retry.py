@@ -0,0 +1,56 @@
+"""Retries for transient artifact service failures."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Awaitable, Callable, TypeVar
+
+logger = logging.getLogger("kagent_adk." + __name__)
+
+T = TypeVar("T")
+
+# Attempts per artifact service call; waits 1s, then 2s between attempts.
+ARTIFACT_SERVICE_ATTEMPTS = 3
+
+
+def _transient_error_types() -> tuple[type[BaseException], ...]:
+    errors: tuple[type[BaseException], ...] = (ConnectionError, TimeoutError)
+    try:
+        from google.api_core import exceptions as gcp_exceptions
+    except ImportError:
+        return errors
+    # Errors raised by the GCS artifact service that are worth retrying
+    return errors + (
+        gcp_exceptions.TooManyRequests,
+        gcp_exceptions.InternalServerError,
+        gcp_exceptions.BadGateway,
+        gcp_exceptions.ServiceUnavailable,
+        gcp_exceptions.GatewayTimeout,
+    )
+
+
+_TRANSIENT_ERRORS = _transient_error_types()
+
+
+async def with_retry(operation: Callable[[], Awaitable[T]], attempts: int = ARTIFACT_SERVICE_ATTEMPTS) -> T:
+    """Run an artifact service call, retrying transient failures with exponential backoff.
+
+    Args:
+        operation: Creates the awaitable for one attempt
+        attempts: Total number of attempts
+
+    Returns:
+        The result of the first successful attempt
+
+    Raises:
+        The last transient error once attempts are exhausted, or any other error immediately.
+    """
+    for attempt in range(attempts - 1):
+        try:
+            return await operation()
+        except _TRANSIENT_ERRORS as e:
+            delay = 2**attempt
+            logger.warning("Transient artifact service error, retrying in %ss: %s: %s", delay, type(e).__name__, e)
+            await asyncio.sleep(delay)
+    return await operation()
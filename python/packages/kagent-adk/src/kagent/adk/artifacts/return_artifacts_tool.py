@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import asyncio
+import functools
 import logging
 import mimetypes
 from pathlib import Path
@@ -11,12 +13,20 @@ from google.adk.tools import BaseTool, ToolContext
 from google.genai import types
 from typing_extensions import override
 
+from ._retry import with_retry
 from .session_path import get_session_path
-from .stage_artifacts_tool import MAX_ARTIFACT_SIZE_BYTES
+from .stage_artifacts_tool import MAX_ARTIFACT_SIZE_BYTES, MAX_CONCURRENT_ARTIFACT_TRANSFERS
 
 logger = logging.getLogger("kagent_adk." + __name__)
 
 
+@functools.lru_cache(maxsize=512)
+def _mime_type_for_suffixes(suffixes: str) -> str:
+    # Only the suffixes (e.g. ".tar.gz") affect the guess, so results are cached per suffix
+    mime_type, _ = mimetypes.guess_type(f"file{suffixes}")
+    return mime_type or "application/octet-stream"
+
+
 class ReturnArtifactsTool(BaseTool):
     """Save generated files from working directory to artifact service for user download.
 
@@ -95,46 +105,49 @@ class ReturnArtifactsTool(BaseTool):
         try:
             working_dir = get_session_path(session_id=tool_context.session.id)
 
-            saved_artifacts = []
-            for idx, rel_path in enumerate(file_paths):
-                file_path = (working_dir / rel_path).resolve()
-
-                # Security: Ensure file is within working directory
-                if not file_path.is_relative_to(working_dir):
-                    logger.warning(f"Skipping file outside working directory: {rel_path}")
-                    continue
-
-                # Check file exists
-                if not file_path.exists():
-                    logger.warning(f"File not found: {rel_path}")
-                    continue
+            semaphore = asyncio.Semaphore(MAX_CONCURRENT_ARTIFACT_TRANSFERS)
 
-                # Check file size
-                file_size = file_path.stat().st_size
-                if file_size > MAX_ARTIFACT_SIZE_BYTES:
-                    size_mb = file_size / (1024 * 1024)
-                    logger.warning(f"File too large: {rel_path} ({size_mb:.1f} MB)")
-                    continue
+            async def save_one(idx: int, rel_path: str) -> str | None:
+                # Path resolution and stat are filesystem calls; keep them off the event loop
+                checked = await asyncio.to_thread(self._check_file, working_dir, rel_path)
+                if checked is None:
+                    return None
+                file_path, file_size = checked
 
                 # Determine artifact name
                 artifact_name = artifact_names[idx] if artifact_names else file_path.name
 
-                # Read file data and detect MIME type
-                file_data = file_path.read_bytes()
-                mime_type = self._detect_mime_type(file_path)
+                async with semaphore:
+                    # Read file data (off the event loop, files can be up to
+                    # MAX_ARTIFACT_SIZE_BYTES) and detect MIME type
+                    file_data = await asyncio.to_thread(file_path.read_bytes)
+                    mime_type = self._detect_mime_type(file_path)
 
-                # Create artifact Part
-                artifact_part = types.Part.from_bytes(data=file_data, mime_type=mime_type)
+                    # Create artifact Part
+                    artifact_part = types.Part.from_bytes(data=file_data, mime_type=mime_type)
 
-                # Save to artifact service
-                version = await tool_context.save_artifact(
-                    filename=artifact_name,
-                    artifact=artifact_part,
-                )
+                    # Save to artifact service
+                    version = await with_retry(
+                        lambda: tool_context.save_artifact(
+                            filename=artifact_name,
+                            artifact=artifact_part,
+                        )
+                    )
 
                 size_kb = file_size / 1024
-                saved_artifacts.append(f"{artifact_name} (v{version}, {size_kb:.1f} KB)")
-                logger.info(f"Saved artifact: {artifact_name} v{version} ({size_kb:.1f} KB)")
+                logger.info("Saved artifact: %s v%s (%.1f KB)", artifact_name, version, size_kb)
+                return f"{artifact_name} (v{version}, {size_kb:.1f} KB)"
+
+            # Files are independent, so they are saved concurrently; results keep
+            # the order of file_paths and the first failure is reported.
+            results = await asyncio.gather(
+                *(save_one(idx, rel_path) for idx, rel_path in enumerate(file_paths)),
+                return_exceptions=True,
+            )
+            for result in results:
+                if isinstance(result, BaseException):
+                    raise result
+            saved_artifacts = [result for result in results if result is not None]
 
             if not saved_artifacts:
                 return "No valid files were saved as artifacts."
@@ -147,6 +160,38 @@ class ReturnArtifactsTool(BaseTool):
             logger.error("Error returning artifacts: %s", e, exc_info=True)
             return f"An error occurred while returning artifacts: {e}"
 
+    def _check_file(self, working_dir: Path, rel_path: str) -> tuple[Path, int] | None:
+        """Resolve a requested file and check that it can be returned.
+
+        Args:
+            working_dir: The session's working directory
+            rel_path: Path of the file relative to the working directory
+
+        Returns:
+            The resolved path and its size in bytes, or None if the file is skipped
+        """
+        file_path = (working_dir / rel_path).resolve()
+
+        # Security: Ensure file is within working directory
+        if not file_path.is_relative_to(working_dir):
+            logger.warning("Skipping file outside working directory: %s", rel_path)
+            return None
+
+        # Check file exists (a single stat also provides the size)
+        try:
+            file_size = file_path.stat().st_size
+        except (FileNotFoundError, NotADirectoryError):
+            logger.warning("File not found: %s", rel_path)
+            return None
+
+        # Check file size
+        if file_size > MAX_ARTIFACT_SIZE_BYTES:
+            size_mb = file_size / (1024 * 1024)
+            logger.warning("File too large: %s (%.1f MB)", rel_path, size_mb)
+            return None
+
+        return file_path, file_size
+
     def _detect_mime_type(self, file_path: Path) -> str:
         """Detect MIME type from file extension.
 
@@ -156,5 +201,4 @@ class ReturnArtifactsTool(BaseTool):
         Returns:
             MIME type string, defaults to 'application/octet-stream' if unknown
         """
-        mime_type, _ = mimetypes.guess_type(str(file_path))
-        return mime_type or "application/octet-stream"
+        return _mime_type_for_suffixes("".join(file_path.suffixes))
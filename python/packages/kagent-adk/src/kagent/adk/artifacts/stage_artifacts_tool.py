@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import asyncio
+import functools
 import logging
 import mimetypes
+import os
 from pathlib import Path
 from typing import Any, List
 
@@ -9,6 +12,7 @@ from google.adk.tools import BaseTool, ToolContext
 from google.genai import types
 from typing_extensions import override
 
+from ._retry import with_retry
 from .session_path import get_session_path
 
 logger = logging.getLogger("kagent_adk." + __name__)
@@ -16,6 +20,48 @@ logger = logging.getLogger("kagent_adk." + __name__)
 # Maximum file size for staging (100 MB)
 MAX_ARTIFACT_SIZE_BYTES = 100 * 1024 * 1024
 
+ARTIFACT_CONCURRENCY_ENV_VAR = "KAGENT_ARTIFACT_CONCURRENCY"
+DEFAULT_ARTIFACT_CONCURRENCY = 8
+
+
+def get_artifact_concurrency() -> int:
+    """Get the maximum number of concurrent artifact transfers per tool call.
+
+    Environment variable:
+        KAGENT_ARTIFACT_CONCURRENCY: Number of artifacts loaded or saved at
+                                     the same time. Default: 8. Values below
+                                     1 are raised to 1.
+
+    Returns:
+        The concurrency limit, falling back to the default for invalid values.
+    """
+    value = os.getenv(ARTIFACT_CONCURRENCY_ENV_VAR)
+    if value is None:
+        return DEFAULT_ARTIFACT_CONCURRENCY
+    try:
+        concurrency = int(value)
+    except ValueError:
+        logger.warning(
+            "Invalid %s value: %s, using default %d",
+            ARTIFACT_CONCURRENCY_ENV_VAR,
+            value,
+            DEFAULT_ARTIFACT_CONCURRENCY,
+        )
+        return DEFAULT_ARTIFACT_CONCURRENCY
+    if concurrency < 1:
+        logger.warning("Invalid %s value: %s (must be at least 1), using 1", ARTIFACT_CONCURRENCY_ENV_VAR, value)
+        return 1
+    return concurrency
+
+
+# Maximum number of artifacts loaded or saved at the same time by one tool call
+MAX_CONCURRENT_ARTIFACT_TRANSFERS = get_artifact_concurrency()
+
+
+@functools.lru_cache(maxsize=512)
+def _extension_for_mime_type(mime_type: str) -> str | None:
+    return mimetypes.guess_extension(mime_type)
+
 
 class StageArtifactsTool(BaseTool):
     """A tool to stage artifacts from the artifact service to the local filesystem.
@@ -103,33 +149,43 @@ class StageArtifactsTool(BaseTool):
 
             destination_dir.mkdir(parents=True, exist_ok=True)
 
-            staged_files = []
-            for name in artifact_names:
-                artifact = await tool_context.load_artifact(name)
-                if artifact is None or artifact.inline_data is None:
-                    logger.warning('Artifact "%s" not found or has no data, skipping', name)
-                    continue
+            semaphore = asyncio.Semaphore(MAX_CONCURRENT_ARTIFACT_TRANSFERS)
+
+            async def stage_one(name: str) -> str | None:
+                async with semaphore:
+                    artifact = await with_retry(lambda: tool_context.load_artifact(name))
+                    if artifact is None or artifact.inline_data is None:
+                        logger.warning('Artifact "%s" not found or has no data, skipping', name)
+                        return None
 
-                # Check file size
-                data_size = len(artifact.inline_data.data)
-                if data_size > MAX_ARTIFACT_SIZE_BYTES:
-                    size_mb = data_size / (1024 * 1024)
-                    logger.warning(f'Artifact "{name}" exceeds size limit: {size_mb:.1f} MB')
-                    continue
+                    # Check file size
+                    data_size = len(artifact.inline_data.data)
+                    if data_size > MAX_ARTIFACT_SIZE_BYTES:
+                        size_mb = data_size / (1024 * 1024)
+                        logger.warning('Artifact "%s" exceeds size limit: %.1f MB', name, size_mb)
+                        return None
 
-                # Use artifact name as filename (frontend should provide meaningful names)
-                # If name has no extension, try to infer from MIME type
-                filename = self._ensure_proper_extension(name, artifact.inline_data.mime_type)
-                output_file = destination_dir / filename
+                    # Use artifact name as filename (frontend should provide meaningful names)
+                    # If name has no extension, try to infer from MIME type
+                    filename = self._ensure_proper_extension(name, artifact.inline_data.mime_type)
+                    output_file = destination_dir / filename
 
-                # Write file to disk
-                output_file.write_bytes(artifact.inline_data.data)
+                    # Write file to disk (off the event loop, artifacts can be up to
+                    # MAX_ARTIFACT_SIZE_BYTES)
+                    await asyncio.to_thread(output_file.write_bytes, artifact.inline_data.data)
 
                 relative_path = output_file.relative_to(staging_root)
                 size_kb = data_size / 1024
-                staged_files.append(f"{relative_path} ({size_kb:.1f} KB)")
+                logger.info("Staged artifact: %s -> %s (%.1f KB)", name, relative_path, size_kb)
+                return f"{relative_path} ({size_kb:.1f} KB)"
 
-                logger.info(f"Staged artifact: {name} -> {relative_path} ({size_kb:.1f} KB)")
+            # Artifacts are independent, so they are loaded concurrently; results
+            # keep the order of artifact_names and the first failure is reported.
+            results = await asyncio.gather(*(stage_one(name) for name in artifact_names), return_exceptions=True)
+            for result in results:
+                if isinstance(result, BaseException):
+                    raise result
+            staged_files = [result for result in results if result is not None]
 
             if not staged_files:
                 return "No valid artifacts were staged."
@@ -163,7 +219,7 @@ class StageArtifactsTool(BaseTool):
             return filename
 
         # Try to infer extension from MIME type
-        extension = mimetypes.guess_extension(mime_type)
+        extension = _extension_for_mime_type(mime_type)
         if extension:
             return f"{filename}{extension}"
 
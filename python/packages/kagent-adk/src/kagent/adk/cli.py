@@ -1,6 +1,5 @@
 import asyncio
 import importlib
-import json
 import logging
 import os
 from typing import Annotated, Optional
@@ -22,7 +21,6 @@ logging.getLogger("google_adk.google.adk.tools.base_authenticated_tool").setLeve
 app = typer.Typer()
 
 
-kagent_url_override = os.getenv("KAGENT_URL")
 sts_well_known_uri = os.getenv("STS_WELL_KNOWN_URI")
 propagate_token = os.getenv("KAGENT_PROPAGATE_TOKEN", "").lower() == "true"
 uvicorn_log_level = os.getenv("UVICORN_LOG_LEVEL", os.getenv("LOG_LEVEL", "info")).lower()
@@ -36,6 +34,13 @@ def create_sts_integration() -> Optional[ADKTokenPropagationPlugin]:
         return ADKTokenPropagationPlugin(sts_integration)
 
 
+def _read_bytes(*path: str) -> bytes:
+    # Config files are handed to pydantic as raw JSON so they are parsed and
+    # validated in a single pass, without building an intermediate dict
+    with open(os.path.join(*path), "rb") as f:
+        return f.read()
+
+
 def maybe_add_skills(root_agent: BaseAgent):
     skills_directory = os.getenv("KAGENT_SKILLS_FOLDER", None)
     if skills_directory:
@@ -60,12 +65,8 @@ def static(
 ):
     app_cfg = KAgentConfig()
 
-    with open(os.path.join(filepath, "config.json"), "r") as f:
-        config = json.load(f)
-    agent_config = AgentConfig.model_validate(config)
-    with open(os.path.join(filepath, "agent-card.json"), "r") as f:
-        agent_card = json.load(f)
-    agent_card = AgentCard.model_validate(agent_card)
+    agent_config = AgentConfig.model_validate_json(_read_bytes(filepath, "config.json"))
+    agent_card = AgentCard.model_validate_json(_read_bytes(filepath, "agent-card.json"))
     plugins = None
     sts_integration = create_sts_integration()
     if sts_integration:
@@ -163,15 +164,11 @@ def run(
     agent_config = None
     config_path = os.path.join(working_dir, name, "config.json")
     try:
-        with open(config_path, "r") as f:
-            config = json.load(f)
-        agent_config = AgentConfig.model_validate(config)
+        agent_config = AgentConfig.model_validate_json(_read_bytes(config_path))
     except FileNotFoundError:
         logger.debug(f"No config.json found at {config_path}, using defaults")
 
-    with open(os.path.join(working_dir, name, "agent-card.json"), "r") as f:
-        agent_card = json.load(f)
-    agent_card = AgentCard.model_validate(agent_card)
+    agent_card = AgentCard.model_validate_json(_read_bytes(working_dir, name, "agent-card.json"))
 
     # Attempt to import optional user-defined lifespan(app) from the agent package
     lifespan = None
@@ -231,16 +228,10 @@ async def test_agent(agent_config: AgentConfig, agent_card: AgentCard, task: str
 @app.command()
 def test(
     task: Annotated[str, typer.Option("--task", help="The task to test the agent with")],
-    filepath: Annotated[str, typer.Option("--filepath", help="The path to the agent config file")],
+    filepath: Annotated[str, typer.Option("--filepath", help="Directory containing config.json and agent-card.json")],
 ):
-    with open(os.path.join(filepath, "config.json"), "r") as f:
-        content = f.read()
-        config = json.loads(content)
-
-    with open(os.path.join(filepath, "agent-card.json"), "r") as f:
-        agent_card = json.load(f)
-    agent_card = AgentCard.model_validate(agent_card)
-    agent_config = AgentConfig.model_validate(config)
+    agent_config = AgentConfig.model_validate_json(_read_bytes(filepath, "config.json"))
+    agent_card = AgentCard.model_validate_json(_read_bytes(filepath, "agent-card.json"))
     asyncio.run(test_agent(agent_config, agent_card, task))
 
 
@@ -3,7 +3,7 @@ from __future__ import annotations
 import logging
 import uuid
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Union
 
 from a2a.server.events import Event as A2AEvent
 from a2a.types import DataPart, Message, Role, Task, TaskState, TaskStatus, TaskStatusUpdateEvent, TextPart
@@ -28,18 +28,38 @@ from .part_converter import (
 
 ARTIFACT_ID_SEPARATOR = "-"
 
+# Metadata keys, computed once rather than on every event conversion
+_ADK_PARTIAL_METADATA_KEY = get_kagent_metadata_key("adk_partial")
+_APP_NAME_METADATA_KEY = get_kagent_metadata_key("app_name")
+_USER_ID_METADATA_KEY = get_kagent_metadata_key("user_id")
+_SESSION_ID_METADATA_KEY = get_kagent_metadata_key("session_id")
+_INVOCATION_ID_METADATA_KEY = get_kagent_metadata_key("invocation_id")
+_AUTHOR_METADATA_KEY = get_kagent_metadata_key("author")
+_BRANCH_METADATA_KEY = get_kagent_metadata_key("branch")
+_GROUNDING_METADATA_METADATA_KEY = get_kagent_metadata_key("grounding_metadata")
+_CUSTOM_METADATA_METADATA_KEY = get_kagent_metadata_key("custom_metadata")
+_USAGE_METADATA_METADATA_KEY = get_kagent_metadata_key("usage_metadata")
+_ERROR_CODE_METADATA_KEY = get_kagent_metadata_key("error_code")
+_SUBAGENT_SESSION_ID_METADATA_KEY = get_kagent_metadata_key("subagent_session_id")
+_TYPE_METADATA_KEY = get_kagent_metadata_key(A2A_DATA_PART_METADATA_TYPE_KEY)
+_IS_LONG_RUNNING_METADATA_KEY = get_kagent_metadata_key(A2A_DATA_PART_METADATA_IS_LONG_RUNNING_KEY)
+
 # Logger
 logger = logging.getLogger("kagent_adk." + __name__)
 
 
-def serialize_metadata_value(value: Any) -> str:
-    """Safely serializes metadata values to string format.
+def serialize_metadata_value(value: Any) -> Union[Dict[str, Any], str]:
+    """Safely serializes metadata values for A2A event metadata.
+
+    Pydantic models are dumped to a dict so they reach clients as JSON objects
+    (the UI reads e.g. usage metadata token counts from them); other values are
+    converted to strings.
 
     Args:
       value: The value to serialize.
 
     Returns:
-      String representation of the value.
+      A dict for pydantic models, otherwise the string representation of the value.
     """
     if hasattr(value, "model_dump"):
         try:
@@ -70,26 +90,25 @@ def _get_context_metadata(event: Event, invocation_context: InvocationContext) -
 
     try:
         metadata: Dict[str, Any] = {
-            get_kagent_metadata_key("adk_partial"): event.partial,
-            get_kagent_metadata_key("app_name"): invocation_context.app_name,
-            get_kagent_metadata_key("user_id"): invocation_context.user_id,
-            get_kagent_metadata_key("session_id"): invocation_context.session.id,
-            get_kagent_metadata_key("invocation_id"): event.invocation_id,
-            get_kagent_metadata_key("author"): event.author,
+            _ADK_PARTIAL_METADATA_KEY: event.partial,
+            _APP_NAME_METADATA_KEY: invocation_context.app_name,
+            _USER_ID_METADATA_KEY: invocation_context.user_id,
+            _SESSION_ID_METADATA_KEY: invocation_context.session.id,
+            _INVOCATION_ID_METADATA_KEY: event.invocation_id,
+            _AUTHOR_METADATA_KEY: event.author,
         }
 
         # Add optional metadata fields if present
-        optional_fields = [
-            ("branch", event.branch),
-            ("grounding_metadata", event.grounding_metadata),
-            ("custom_metadata", event.custom_metadata),
-            ("usage_metadata", event.usage_metadata),
-            ("error_code", event.error_code),
-        ]
-
-        for field_name, field_value in optional_fields:
-            if field_value is not None:
-                metadata[get_kagent_metadata_key(field_name)] = serialize_metadata_value(field_value)
+        if (branch := event.branch) is not None:
+            metadata[_BRANCH_METADATA_KEY] = serialize_metadata_value(branch)
+        if (grounding_metadata := event.grounding_metadata) is not None:
+            metadata[_GROUNDING_METADATA_METADATA_KEY] = serialize_metadata_value(grounding_metadata)
+        if (custom_metadata := event.custom_metadata) is not None:
+            metadata[_CUSTOM_METADATA_METADATA_KEY] = serialize_metadata_value(custom_metadata)
+        if (usage_metadata := event.usage_metadata) is not None:
+            metadata[_USAGE_METADATA_METADATA_KEY] = serialize_metadata_value(usage_metadata)
+        if (error_code := event.error_code) is not None:
+            metadata[_ERROR_CODE_METADATA_KEY] = serialize_metadata_value(error_code)
 
         return metadata
 
@@ -98,6 +117,19 @@ def _get_context_metadata(event: Event, invocation_context: InvocationContext) -
         raise
 
 
+def _own_context_metadata(
+    event: Event, invocation_context: InvocationContext, context_metadata: Optional[Dict[str, Any]]
+) -> Dict[str, Any]:
+    """Returns a context metadata dict owned by a single A2A event.
+
+    Events are built with ``model_construct``, which does not copy its
+    arguments, so precomputed metadata is copied rather than shared.
+    """
+    if context_metadata is None:
+        return _get_context_metadata(event, invocation_context)
+    return dict(context_metadata)
+
+
 def _create_artifact_id(app_name: str, user_id: str, session_id: str, filename: str, version: int) -> str:
     """Creates a unique artifact ID.
 
@@ -122,15 +154,20 @@ def _process_long_running_tool(a2a_part: A2APart, event: Event) -> None:
       a2a_part: The A2A part to potentially mark as long-running.
       event: The ADK event containing long-running tool information.
     """
+    # Most events have no long-running tools, so check that first
+    long_running_tool_ids = event.long_running_tool_ids
+    if not long_running_tool_ids:
+        return
+    root = a2a_part.root
+    if not isinstance(root, DataPart):
+        return
+    metadata = root.metadata
     if (
-        isinstance(a2a_part.root, DataPart)
-        and event.long_running_tool_ids
-        and a2a_part.root.metadata
-        and a2a_part.root.metadata.get(get_kagent_metadata_key(A2A_DATA_PART_METADATA_TYPE_KEY))
-        == A2A_DATA_PART_METADATA_TYPE_FUNCTION_CALL
-        and a2a_part.root.data.get("id") in event.long_running_tool_ids
+        metadata
+        and metadata.get(_TYPE_METADATA_KEY) == A2A_DATA_PART_METADATA_TYPE_FUNCTION_CALL
+        and root.data.get("id") in long_running_tool_ids
     ):
-        a2a_part.root.metadata[get_kagent_metadata_key(A2A_DATA_PART_METADATA_IS_LONG_RUNNING_KEY)] = True
+        metadata[_IS_LONG_RUNNING_METADATA_KEY] = True
 
 
 def _process_subagent_session_id(a2a_part: A2APart, subagent_session_ids: Dict[str, str]) -> None:
@@ -146,14 +183,11 @@ def _process_subagent_session_id(a2a_part: A2APart, subagent_session_ids: Dict[s
     """
     if not isinstance(a2a_part.root, DataPart) or not a2a_part.root.metadata:
         return
-    if (
-        a2a_part.root.metadata.get(get_kagent_metadata_key(A2A_DATA_PART_METADATA_TYPE_KEY))
-        != A2A_DATA_PART_METADATA_TYPE_FUNCTION_CALL
-    ):
+    if a2a_part.root.metadata.get(_TYPE_METADATA_KEY) != A2A_DATA_PART_METADATA_TYPE_FUNCTION_CALL:
         return
     tool_name = a2a_part.root.data.get("name") if isinstance(a2a_part.root.data, dict) else None
     if tool_name and tool_name in subagent_session_ids:
-        a2a_part.root.metadata[get_kagent_metadata_key("subagent_session_id")] = subagent_session_ids[tool_name]
+        a2a_part.root.metadata[_SUBAGENT_SESSION_ID_METADATA_KEY] = subagent_session_ids[tool_name]
 
 
 def convert_event_to_a2a_message(
@@ -161,6 +195,7 @@ def convert_event_to_a2a_message(
     invocation_context: InvocationContext,
     role: Role = Role.agent,
     subagent_session_ids: Optional[Dict[str, str]] = None,
+    context_metadata: Optional[Dict[str, Any]] = None,
 ) -> Optional[Message]:
     """Converts an ADK event to an A2A message.
 
@@ -171,6 +206,8 @@ def convert_event_to_a2a_message(
       subagent_session_ids: Optional mapping of tool name to pre-generated
         subagent session ID.  When provided, function_call DataParts for
         matching tools will have the session ID stamped into their metadata.
+      context_metadata: Optional context metadata already computed for this
+        event; computed from the event when not provided.
 
     Returns:
       An A2A Message if the event has content, None otherwise.
@@ -197,8 +234,13 @@ def convert_event_to_a2a_message(
                     _process_subagent_session_id(a2a_part, subagent_session_ids)
 
         if a2a_parts:
-            message_metadata = _get_context_metadata(event, invocation_context)
-            return Message(message_id=str(uuid.uuid4()), role=role, parts=a2a_parts, metadata=message_metadata)
+            # Parts come out of the part converter already validated
+            return Message.model_construct(
+                message_id=uuid.uuid4().hex,
+                role=role,
+                parts=a2a_parts,
+                metadata=_own_context_metadata(event, invocation_context, context_metadata),
+            )
 
     except Exception as e:
         logger.error("Failed to convert event to status message: %s", e)
@@ -212,6 +254,7 @@ def _create_error_status_event(
     invocation_context: InvocationContext,
     task_id: Optional[str] = None,
     context_id: Optional[str] = None,
+    context_metadata: Optional[Dict[str, Any]] = None,
 ) -> TaskStatusUpdateEvent:
     """Creates a TaskStatusUpdateEvent for error scenarios.
 
@@ -220,31 +263,33 @@ def _create_error_status_event(
       invocation_context: The invocation context.
       task_id: Optional task ID to use for generated events.
       context_id: Optional Context ID to use for generated events.
+      context_metadata: Optional context metadata already computed for this
+        event; computed from the event when not provided.
 
     Returns:
       A TaskStatusUpdateEvent with FAILED state.
     """
     error_message = getattr(event, "error_message", None)
 
-    # Get context metadata and add error code
-    event_metadata = _get_context_metadata(event, invocation_context)
+    # The context metadata already carries the error code
+    message_metadata = {}
     if event.error_code:
-        event_metadata[get_kagent_metadata_key("error_code")] = str(event.error_code)
+        message_metadata[_ERROR_CODE_METADATA_KEY] = str(event.error_code)
 
         if not error_message:
             error_message = _get_error_message(event.error_code)
 
-    return TaskStatusUpdateEvent(
+    return TaskStatusUpdateEvent.model_construct(
         task_id=task_id,
         context_id=context_id,
-        metadata=event_metadata,
-        status=TaskStatus(
+        metadata=_own_context_metadata(event, invocation_context, context_metadata),
+        status=TaskStatus.model_construct(
             state=TaskState.failed,
-            message=Message(
-                message_id=str(uuid.uuid4()),
+            message=Message.model_construct(
+                message_id=uuid.uuid4().hex,
                 role=Role.agent,
-                parts=[A2APart(TextPart(text=error_message))],
-                metadata={get_kagent_metadata_key("error_code"): str(event.error_code)} if event.error_code else {},
+                parts=[A2APart.model_construct(root=TextPart.model_construct(text=error_message))],
+                metadata=message_metadata,
             ),
             timestamp=datetime.now(timezone.utc).isoformat(),
         ),
@@ -258,6 +303,7 @@ def _create_status_update_event(
     event: Event,
     task_id: Optional[str] = None,
     context_id: Optional[str] = None,
+    context_metadata: Optional[Dict[str, Any]] = None,
 ) -> TaskStatusUpdateEvent:
     """Creates a TaskStatusUpdateEvent for running scenarios.
 
@@ -267,40 +313,39 @@ def _create_status_update_event(
       event: The ADK event.
       task_id: Optional task ID to use for generated events.
       context_id: Optional Context ID to use for generated events.
+      context_metadata: Optional context metadata already computed for this
+        event; computed from the event when not provided.
 
 
     Returns:
       A TaskStatusUpdateEvent with RUNNING state.
     """
-    status = TaskStatus(
-        state=TaskState.working,
+    # A long-running function call waits on the user; the EUC (end-user
+    # credential) request takes precedence because it needs an auth flow.
+    state = TaskState.working
+    for part in message.parts:
+        metadata = part.root.metadata
+        if (
+            metadata
+            and metadata.get(_TYPE_METADATA_KEY) == A2A_DATA_PART_METADATA_TYPE_FUNCTION_CALL
+            and metadata.get(_IS_LONG_RUNNING_METADATA_KEY) is True
+        ):
+            if part.root.data.get("name") == REQUEST_EUC_FUNCTION_CALL_NAME:
+                state = TaskState.auth_required
+                break
+            state = TaskState.input_required
+
+    status = TaskStatus.model_construct(
+        state=state,
         message=message,
         timestamp=datetime.now(timezone.utc).isoformat(),
     )
 
-    if any(
-        part.root.metadata.get(get_kagent_metadata_key(A2A_DATA_PART_METADATA_TYPE_KEY))
-        == A2A_DATA_PART_METADATA_TYPE_FUNCTION_CALL
-        and part.root.metadata.get(get_kagent_metadata_key(A2A_DATA_PART_METADATA_IS_LONG_RUNNING_KEY)) is True
-        and part.root.data.get("name") == REQUEST_EUC_FUNCTION_CALL_NAME
-        for part in message.parts
-        if part.root.metadata
-    ):
-        status.state = TaskState.auth_required
-    elif any(
-        part.root.metadata.get(get_kagent_metadata_key(A2A_DATA_PART_METADATA_TYPE_KEY))
-        == A2A_DATA_PART_METADATA_TYPE_FUNCTION_CALL
-        and part.root.metadata.get(get_kagent_metadata_key(A2A_DATA_PART_METADATA_IS_LONG_RUNNING_KEY)) is True
-        for part in message.parts
-        if part.root.metadata
-    ):
-        status.state = TaskState.input_required
-
-    return TaskStatusUpdateEvent(
+    return TaskStatusUpdateEvent.model_construct(
         task_id=task_id,
         context_id=context_id,
         status=status,
-        metadata=_get_context_metadata(event, invocation_context),
+        metadata=_own_context_metadata(event, invocation_context, context_metadata),
         final=False,
     )
 
@@ -336,15 +381,26 @@ def convert_event_to_a2a_events(
     a2a_events = []
 
     try:
+        # The context metadata is the same for every A2A event produced from this
+        # ADK event; it is built at most once and copied into each event.
+        context_metadata = None
+
         # Handle error scenarios
         if event.error_code and not _is_normal_completion(event.error_code):
-            error_event = _create_error_status_event(event, invocation_context, task_id, context_id)
+            context_metadata = _get_context_metadata(event, invocation_context)
+            error_event = _create_error_status_event(
+                event, invocation_context, task_id, context_id, context_metadata=context_metadata
+            )
             a2a_events.append(error_event)
 
         # Handle regular message content
-        message = convert_event_to_a2a_message(event, invocation_context, subagent_session_ids=subagent_session_ids)
+        message = convert_event_to_a2a_message(
+            event, invocation_context, subagent_session_ids=subagent_session_ids, context_metadata=context_metadata
+        )
         if message:
-            running_event = _create_status_update_event(message, invocation_context, event, task_id, context_id)
+            running_event = _create_status_update_event(
+                message, invocation_context, event, task_id, context_id, context_metadata=message.metadata
+            )
             a2a_events.append(running_event)
 
     except Exception as e:
@@ -12,11 +12,13 @@ import asyncio
 import json
 import logging
 import os
-from typing import Any, List, Union
+from typing import TYPE_CHECKING, Any, List, Union
 
 import numpy as np
 
-from kagent.adk.types import EmbeddingConfig
+if TYPE_CHECKING:
+    # kagent.adk.types imports the model modules, so only import it for typing.
+    from kagent.adk.types import EmbeddingConfig
 
 logger = logging.getLogger(__name__)
 
@@ -32,7 +34,7 @@ class KAgentEmbedding:
     # Target dimension for Kagent memory storage (must match go/adk/pkg/embedding/embedding.go)
     TARGET_DIMENSION = 768
 
-    def __init__(self, config: EmbeddingConfig):
+    def __init__(self, config: "EmbeddingConfig"):
         """Initialize EmbeddingClient.
 
         Args:
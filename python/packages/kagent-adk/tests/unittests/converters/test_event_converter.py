@@ -2,9 +2,11 @@ from unittest.mock import Mock
 
 import pytest
 from a2a.types import TaskState, TaskStatusUpdateEvent
+from google.adk.flows.llm_flows.functions import REQUEST_EUC_FUNCTION_CALL_NAME
 from google.genai import types as genai_types
 from kagent.core.a2a import get_kagent_metadata_key
 
+from kagent.adk.converters import event_converter
 from kagent.adk.converters.event_converter import convert_event_to_a2a_events
 
 
@@ -29,9 +31,17 @@ def _create_mock_event(error_code=None, content=None, invocation_id="test_invoca
     event.custom_metadata = None
     event.usage_metadata = None
     event.error_message = None
+    event.partial = False
     return event
 
 
+def _assert_valid(a2a_events):
+    """Events are built without validation; check they survive a validating round trip."""
+    for a2a_event in a2a_events:
+        dumped = a2a_event.model_dump(mode="json")
+        assert type(a2a_event).model_validate(dumped).model_dump(mode="json") == dumped
+
+
 class TestEventConverter:
     """Test cases for event converter functions."""
 
@@ -117,3 +127,59 @@ class TestEventConverter:
         error_code_key = get_kagent_metadata_key("error_code")
         assert error_code_key in error_event.metadata
         assert error_event.metadata[error_code_key] == str(genai_types.FinishReason.MALFORMED_FUNCTION_CALL)
+
+    @pytest.mark.parametrize(
+        ("calls", "long_running_ids", "expected_state"),
+        [
+            ([("call-1", "get_weather")], set(), TaskState.working),
+            ([("call-1", "get_weather")], {"call-1"}, TaskState.input_required),
+            (
+                [("call-1", "get_weather"), ("call-2", REQUEST_EUC_FUNCTION_CALL_NAME)],
+                {"call-1", "call-2"},
+                TaskState.auth_required,
+            ),
+            (
+                [("call-1", REQUEST_EUC_FUNCTION_CALL_NAME), ("call-2", "get_weather")],
+                {"call-2"},
+                TaskState.input_required,
+            ),
+        ],
+    )
+    def test_status_state_for_long_running_function_calls(self, calls, long_running_ids, expected_state):
+        """Long-running function calls require input; long-running EUC requests require auth."""
+        parts = [
+            genai_types.Part(function_call=genai_types.FunctionCall(id=call_id, name=name, args={}))
+            for call_id, name in calls
+        ]
+        event = _create_mock_event(content=genai_types.Content(role="model", parts=parts))
+        event.long_running_tool_ids = long_running_ids
+
+        result = convert_event_to_a2a_events(event, _create_mock_invocation_context(), "task", "context")
+
+        assert [e.status.state for e in result] == [expected_state]
+        _assert_valid(result)
+
+    def test_context_metadata_built_once_per_event(self, monkeypatch):
+        """Error and running events share one context metadata computation."""
+        calls = []
+        original = event_converter._get_context_metadata
+
+        def counting_get_context_metadata(event, invocation_context):
+            calls.append(event)
+            return original(event, invocation_context)
+
+        monkeypatch.setattr(event_converter, "_get_context_metadata", counting_get_context_metadata)
+        event = _create_mock_event(
+            error_code=genai_types.FinishReason.MAX_TOKENS,
+            content=genai_types.Content(role="model", parts=[genai_types.Part(text="partial answer")]),
+        )
+        event.long_running_tool_ids = None
+
+        result = convert_event_to_a2a_events(event, _create_mock_invocation_context(), "task", "context")
+
+        assert [e.status.state for e in result] == [TaskState.failed, TaskState.working]
+        assert len(calls) == 1
+        assert result[0].metadata == result[1].metadata == result[1].status.message.metadata
+        assert result[0].metadata is not result[1].metadata
+        assert result[1].metadata is not result[1].status.message.metadata
+        _assert_valid(result)
@@ -0,0 +1,146 @@
+"""Tests for the FastAPI application built by KAgentApp."""
+
+import asyncio
+from contextlib import asynccontextmanager
+
+import httpx
+import pytest
+from a2a.types import AgentCapabilities, AgentCard
+from fastapi.testclient import TestClient
+from google.adk.agents import BaseAgent
+
+from kagent.adk import KAgentApp
+from kagent.adk._lifespan import loop_monitor_lifespan
+
+
+def _agent_card() -> AgentCard:
+    return AgentCard(
+        name="test-agent",
+        description="Test agent",
+        url="http://localhost:8080",
+        version="0.1.0",
+        capabilities=AgentCapabilities(),
+        default_input_modes=["text"],
+        default_output_modes=["text"],
+        skills=[],
+    )
+
+
+@pytest.fixture
+def kagent_app() -> KAgentApp:
+    return KAgentApp(
+        root_agent_factory=lambda: BaseAgent(name="test_agent"),
+        agent_card=_agent_card(),
+        kagent_url="http://kagent.example.com",
+        app_name="test_app",
+    )
+
+
+@pytest.fixture
+def client(kagent_app: KAgentApp) -> TestClient:
+    return TestClient(kagent_app.build(local=True))
+
+
+def test_build_is_memoized_per_mode(kagent_app: KAgentApp):
+    local_app = kagent_app.build(local=True)
+
+    assert kagent_app.build(local=True) is local_app
+    assert kagent_app.build(local=False) is not local_app
+
+
+def test_built_app_survives_repeated_lifespans(kagent_app: KAgentApp, monkeypatch: pytest.MonkeyPatch):
+    requested_paths = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requested_paths.append(request.url.path)
+        return httpx.Response(404)
+
+    real_async_client = httpx.AsyncClient
+    monkeypatch.setattr(
+        "kagent.adk._a2a.httpx.AsyncClient",
+        lambda **kwargs: real_async_client(transport=httpx.MockTransport(handler), **kwargs),
+    )
+    app = kagent_app.build()
+    get_task = {"jsonrpc": "2.0", "id": "1", "method": "tasks/get", "params": {"id": "missing-task"}}
+
+    for _ in range(2):
+        assert kagent_app.build() is app
+        with TestClient(app) as client:
+            response = client.post("/", json=get_task)
+
+        assert response.status_code == 200
+        assert response.json()["error"]["code"] == -32001  # TaskNotFoundError
+
+    assert requested_paths == ["/api/tasks/missing-task"] * 2
+
+
+def test_health_check(client: TestClient):
+    response = client.get("/health")
+
+    assert response.status_code == 200
+    assert response.text == "OK"
+    assert response.headers["content-type"] == "text/plain; charset=utf-8"
+    assert response.headers["content-length"] == "2"
+
+
+def test_health_check_rejects_other_methods(client: TestClient):
+    response = client.post("/health")
+
+    assert response.status_code == 405
+
+
+def test_thread_dump(client: TestClient):
+    response = client.get("/thread_dump")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "text/plain; charset=utf-8"
+    assert "Thread" in response.text
+
+
+def test_agent_card_route_is_registered(client: TestClient):
+    response = client.get("/.well-known/agent-card.json")
+
+    assert response.status_code == 200
+    assert response.json()["name"] == "test-agent"
+
+
+def test_loop_monitor_is_disabled_by_default(monkeypatch):
+    monkeypatch.delenv("KAGENT_DEBUG", raising=False)
+
+    assert loop_monitor_lifespan() is None
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [("0.25", 0.25), ("slow", 0.1), ("0", 0.1), ("-1", 0.1), ("nan", 0.1)],
+)
+def test_loop_monitor_sets_slow_callback_duration(monkeypatch, kagent_app: KAgentApp, value, expected):
+    monkeypatch.setenv("KAGENT_DEBUG", "1")
+    monkeypatch.setenv("KAGENT_SLOW_CALLBACK_S", value)
+    captured = {}
+
+    @asynccontextmanager
+    async def capture_loop(app):
+        loop = asyncio.get_running_loop()
+        captured["debug"] = loop.get_debug()
+        captured["slow_callback_duration"] = loop.slow_callback_duration
+        yield
+
+    kagent_app._lifespan = capture_loop
+    with TestClient(kagent_app.build(local=True)):
+        pass
+
+    assert captured == {"debug": True, "slow_callback_duration": expected}
+
+
+async def test_loop_monitor_stops_probe_and_restores_loop_settings(monkeypatch):
+    monkeypatch.setenv("KAGENT_DEBUG", "1")
+    loop = asyncio.get_running_loop()
+    debug, slow_callback_duration = loop.get_debug(), loop.slow_callback_duration
+    before = asyncio.all_tasks()
+
+    async with loop_monitor_lifespan()(None):
+        assert len(asyncio.all_tasks() - before) == 1
+
+    assert asyncio.all_tasks() - before == set()
+    assert (loop.get_debug(), loop.slow_callback_duration) == (debug, slow_callback_duration)
@@ -0,0 +1,167 @@
+"""Tests for helpers in the kagent A2A agent executor."""
+
+from types import SimpleNamespace
+
+import pytest
+from a2a.server.events.event_queue import EventQueue
+from a2a.types import DataPart, Message, Part, Role, TaskState, TaskStatusUpdateEvent, TextPart
+from google.adk.agents.run_config import RunConfig
+from google.adk.sessions import InMemorySessionService
+from google.adk.sessions.base_session_service import GetSessionConfig
+
+from kagent.adk._agent_executor import _FUNCTION_CALLING_ERROR_RE, _MODEL_JSON_ERROR_RE, A2aAgentExecutor
+from kagent.adk.converters.request_converter import convert_a2a_request_to_adk_run_args
+
+
+def _is_function_calling_error(message: str) -> bool:
+    return bool(_MODEL_JSON_ERROR_RE.search(message) and _FUNCTION_CALLING_ERROR_RE.search(message))
+
+
+@pytest.mark.parametrize(
+    "message",
+    [
+        "JSONDecodeError: Expecting value while parsing function_call arguments",
+        "Unterminated string starting at: line 1 column 9 in Function_Call",
+        "APIConnectionError: json.loads failed",
+    ],
+)
+def test_function_calling_errors_are_detected(message):
+    assert _is_function_calling_error(message)
+
+
+@pytest.mark.parametrize(
+    "message",
+    [
+        "JSONDecodeError: Expecting value",
+        "function_call is not supported",
+        "APIConnectionError: JSON.LOADS failed",
+    ],
+)
+def test_other_errors_are_not_detected(message):
+    assert not _is_function_calling_error(message)
+
+
+async def _prepare_session(parts: list[Part]):
+    executor = A2aAgentExecutor(runner=lambda: None)
+    runner = SimpleNamespace(app_name="test_app", session_service=InMemorySessionService())
+    context = SimpleNamespace(
+        message=Message(message_id="m1", role=Role.user, parts=parts),
+        call_context=None,
+    )
+    run_args = {"user_id": "user", "session_id": "session"}
+    return await executor._prepare_session(context, run_args, runner)
+
+
+async def test_new_session_is_named_after_first_text_part():
+    session = await _prepare_session(
+        [
+            Part(DataPart(data={"k": "v"})),
+            Part(TextPart(text="")),
+            Part(TextPart(text="  Why are my pods crash looping?  ")),
+            Part(TextPart(text="ignored")),
+        ]
+    )
+
+    assert session.state["session_name"] == "Why are my pods cras..."
+
+
+async def test_new_session_without_text_has_no_name():
+    session = await _prepare_session([Part(DataPart(data={"k": "v"}))])
+
+    assert session.state["session_name"] is None
+
+
+async def test_failed_status_event_round_trips():
+    executor = A2aAgentExecutor(runner=lambda: None)
+    event_queue = EventQueue()
+    context = SimpleNamespace(task_id="task", context_id="ctx")
+
+    await executor._publish_failed_status_event(context, event_queue, "boom")
+
+    event = await event_queue.dequeue_event(no_wait=True)
+    revalidated = TaskStatusUpdateEvent.model_validate(event.model_dump(mode="json", by_alias=True))
+    assert revalidated == event
+    assert revalidated.final is True
+    assert revalidated.status.state == TaskState.failed
+    assert revalidated.status.message.parts[0].root.text == "boom"
+
+
+class _StopAfterHeaders(Exception):
+    pass
+
+
+async def _handle_request_headers(session_service, session, headers, run_config=None):
+    """Runs _handle_request up to invocation setup and returns the stored session."""
+
+    def _new_invocation_context(**kwargs):
+        raise _StopAfterHeaders
+
+    executor = A2aAgentExecutor(runner=lambda: None)
+    runner = SimpleNamespace(
+        app_name="test_app",
+        session_service=session_service,
+        _new_invocation_context=_new_invocation_context,
+    )
+    context = SimpleNamespace(
+        message=Message(message_id="m1", role=Role.user, parts=[Part(TextPart(text="hi"))]),
+        call_context=SimpleNamespace(state={"headers": headers} if headers is not None else {}),
+        task_id="task",
+        context_id="ctx",
+    )
+    run_args = {"user_id": session.user_id, "session_id": session.id, "new_message": None, "run_config": run_config}
+    with pytest.raises(_StopAfterHeaders):
+        await executor._handle_request(context, EventQueue(), runner, run_args)
+    stored = await session_service.get_session(app_name="test_app", user_id=session.user_id, session_id=session.id)
+    return stored
+
+
+async def test_headers_are_recorded_only_when_changed():
+    session_service = InMemorySessionService()
+    session = await session_service.create_session(app_name="test_app", user_id="user", session_id="s1")
+
+    stored = await _handle_request_headers(session_service, session, {"x-user": "a"})
+    assert stored.state["headers"] == {"x-user": "a"}
+    assert len(stored.events) == 1
+
+    stored = await _handle_request_headers(session_service, stored, {"x-user": "a"})
+    assert len(stored.events) == 1
+
+    stored = await _handle_request_headers(session_service, stored, {"x-user": "b"})
+    assert stored.state["headers"] == {"x-user": "b"}
+    assert len(stored.events) == 2
+
+
+def test_request_run_config_loads_all_session_events():
+    # Skipping unchanged headers relies on the runner loading the whole event
+    # history; see test_headers_are_recorded_every_time_when_events_are_limited.
+    context = SimpleNamespace(
+        message=Message(message_id="m1", role=Role.user, parts=[Part(TextPart(text="hi"))]),
+        call_context=None,
+        context_id="ctx",
+    )
+
+    run_args = convert_a2a_request_to_adk_run_args(context)
+
+    assert run_args["run_config"].get_session_config is None
+
+
+async def test_headers_are_recorded_every_time_when_events_are_limited():
+    session_service = InMemorySessionService()
+    session = await session_service.create_session(app_name="test_app", user_id="user", session_id="s1")
+    run_config = RunConfig(get_session_config=GetSessionConfig(num_recent_events=1))
+
+    stored = await _handle_request_headers(session_service, session, {"x-user": "a"}, run_config)
+    stored = await _handle_request_headers(session_service, stored, {"x-user": "a"}, run_config)
+
+    assert len(stored.events) == 2
+    assert stored.state["headers"] == {"x-user": "a"}
+
+
+async def test_missing_headers_record_nothing():
+    session_service = InMemorySessionService()
+    session = await session_service.create_session(app_name="test_app", user_id="user", session_id="s1")
+
+    stored = await _handle_request_headers(session_service, session, None)
+
+    assert stored.events == []
+    assert "headers" not in stored.state
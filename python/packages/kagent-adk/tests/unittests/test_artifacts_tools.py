@@ -0,0 +1,189 @@
+"""Tests for the stage_artifacts and return_artifacts tools."""
+
+import asyncio
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+from google.genai import types
+
+from kagent.adk.artifacts import _retry, return_artifacts_tool, session_path
+from kagent.adk.artifacts.return_artifacts_tool import ReturnArtifactsTool
+from kagent.adk.artifacts.stage_artifacts_tool import StageArtifactsTool, get_artifact_concurrency
+
+
+class _FakeToolContext:
+    """Minimal ToolContext backed by an in-memory dict of artifacts."""
+
+    def __init__(self, session_id: str, artifacts: dict[str, types.Part] | None = None, delay: float = 0.0):
+        self.session = SimpleNamespace(id=session_id)
+        self._invocation_context = SimpleNamespace(artifact_service=object())
+        self.artifacts = dict(artifacts or {})
+        self.delay = delay
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def _transfer(self):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(self.delay)
+        self.in_flight -= 1
+
+    async def save_artifact(self, filename: str, artifact: types.Part) -> int:
+        await self._transfer()
+        self.artifacts[filename] = artifact
+        return 0
+
+    async def load_artifact(self, filename: str) -> types.Part | None:
+        await self._transfer()
+        return self.artifacts.get(filename)
+
+
+@pytest.fixture
+def working_dir(tmp_path, monkeypatch):
+    monkeypatch.setitem(session_path._session_path_cache, "s1", tmp_path)
+    (tmp_path / "outputs").mkdir()
+    return tmp_path
+
+
+async def test_return_artifacts_saves_files_concurrently_in_order(working_dir):
+    for name in ("a.txt", "b.csv", "c.json"):
+        (working_dir / "outputs" / name).write_text(name)
+    tool_context = _FakeToolContext("s1", delay=0.01)
+
+    result = await ReturnArtifactsTool().run_async(
+        args={"file_paths": ["outputs/a.txt", "outputs/missing.txt", "outputs/b.csv", "outputs/c.json"]},
+        tool_context=tool_context,
+    )
+
+    assert result.splitlines()[0] == "Saved 3 file(s) for download:"
+    assert [line.split()[1] for line in result.splitlines()[1:]] == ["a.txt", "b.csv", "c.json"]
+    assert tool_context.artifacts["b.csv"].inline_data.data == b"b.csv"
+    assert tool_context.artifacts["b.csv"].inline_data.mime_type == "text/csv"
+    assert tool_context.max_in_flight == 3
+
+
+async def test_return_artifacts_limits_concurrent_saves(working_dir, monkeypatch):
+    monkeypatch.setattr(return_artifacts_tool, "MAX_CONCURRENT_ARTIFACT_TRANSFERS", 2)
+    for idx in range(5):
+        (working_dir / "outputs" / f"{idx}.txt").write_bytes(b"x")
+    tool_context = _FakeToolContext("s1")
+
+    result = await ReturnArtifactsTool().run_async(
+        args={"file_paths": [f"outputs/{idx}.txt" for idx in range(5)]}, tool_context=tool_context
+    )
+
+    assert result.startswith("Saved 5 file(s)")
+    assert tool_context.max_in_flight == 2
+
+
+async def test_return_artifacts_skips_files_outside_working_dir(working_dir):
+    tool_context = _FakeToolContext("s1")
+
+    result = await ReturnArtifactsTool().run_async(args={"file_paths": ["../escape.txt"]}, tool_context=tool_context)
+
+    assert result == "No valid files were saved as artifacts."
+    assert tool_context.artifacts == {}
+
+
+async def test_return_artifacts_skips_missing_files_and_symlink_escapes(working_dir, tmp_path_factory):
+    outside = tmp_path_factory.mktemp("outside") / "secret.txt"
+    outside.write_text("secret")
+    (working_dir / "outputs" / "link.txt").symlink_to(outside)
+    tool_context = _FakeToolContext("s1")
+
+    result = await ReturnArtifactsTool().run_async(
+        args={"file_paths": ["outputs/missing.txt", "outputs/link.txt"]}, tool_context=tool_context
+    )
+
+    assert result == "No valid files were saved as artifacts."
+    assert tool_context.artifacts == {}
+
+
+def test_detect_mime_type_keeps_compound_extensions():
+    tool = ReturnArtifactsTool()
+
+    assert tool._detect_mime_type(Path("report.CSV")) == "text/csv"
+    assert tool._detect_mime_type(Path("logs/a.tar.gz")) == "application/x-tar"
+    assert tool._detect_mime_type(Path("Makefile")) == "application/octet-stream"
+
+
+async def test_stage_artifacts_writes_files_in_order(working_dir):
+    tool_context = _FakeToolContext(
+        "s1",
+        artifacts={
+            "report": types.Part.from_bytes(data=b"report", mime_type="text/plain"),
+            "data.csv": types.Part.from_bytes(data=b"x,y", mime_type="text/csv"),
+        },
+        delay=0.01,
+    )
+
+    result = await StageArtifactsTool().run_async(
+        args={"artifact_names": ["report", "missing", "data.csv"]}, tool_context=tool_context
+    )
+
+    assert result.splitlines()[0] == "Successfully staged 2 file(s):"
+    assert [line.split()[1] for line in result.splitlines()[1:]] == ["uploads/report.txt", "uploads/data.csv"]
+    assert (working_dir / "uploads" / "report.txt").read_bytes() == b"report"
+    assert (working_dir / "uploads" / "data.csv").read_bytes() == b"x,y"
+    assert tool_context.max_in_flight == 3
+
+
+async def test_with_retry_retries_transient_errors(monkeypatch):
+    delays = []
+
+    async def fake_sleep(delay):
+        delays.append(delay)
+
+    monkeypatch.setattr(_retry.asyncio, "sleep", fake_sleep)
+    outcomes = [ConnectionError("reset"), TimeoutError("slow"), "ok"]
+
+    async def operation():
+        outcome = outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    assert await _retry.with_retry(operation) == "ok"
+    assert delays == [1, 2]
+
+
+async def test_with_retry_gives_up_after_last_attempt(monkeypatch):
+    async def fake_sleep(delay):
+        pass
+
+    monkeypatch.setattr(_retry.asyncio, "sleep", fake_sleep)
+    calls = []
+
+    async def operation():
+        calls.append(1)
+        raise ConnectionError("down")
+
+    with pytest.raises(ConnectionError):
+        await _retry.with_retry(operation)
+    assert len(calls) == 3
+
+
+async def test_with_retry_does_not_retry_other_errors():
+    calls = []
+
+    async def operation():
+        calls.append(1)
+        raise ValueError("bad artifact")
+
+    with pytest.raises(ValueError):
+        await _retry.with_retry(operation)
+    assert len(calls) == 1
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [(None, 8), ("3", 3), ("0", 1), ("-2", 1), ("eight", 8), ("", 8)],
+)
+def test_artifact_concurrency_from_env(monkeypatch, value, expected):
+    if value is None:
+        monkeypatch.delenv("KAGENT_ARTIFACT_CONCURRENCY", raising=False)
+    else:
+        monkeypatch.setenv("KAGENT_ARTIFACT_CONCURRENCY", value)
+
+    assert get_artifact_concurrency() == expected
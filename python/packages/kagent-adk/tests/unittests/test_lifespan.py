@@ -0,0 +1,50 @@
+from contextlib import asynccontextmanager
+
+import pytest
+
+from kagent.adk._lifespan import LifespanManager
+
+
+def _recording_lifespan(name: str, calls: list[str]):
+    @asynccontextmanager
+    async def lifespan(app):
+        calls.append(f"enter {name}")
+        try:
+            yield
+        finally:
+            calls.append(f"exit {name}")
+
+    return lifespan
+
+
+async def test_lifespans_enter_in_order_and_exit_in_reverse():
+    calls: list[str] = []
+    manager = LifespanManager()
+    manager.add(_recording_lifespan("a", calls))
+    manager.add(None)
+    manager.add(_recording_lifespan("b", calls))
+
+    async with manager(app=None):
+        calls.append("running")
+
+    assert calls == ["enter a", "enter b", "running", "exit b", "exit a"]
+
+
+async def test_failed_startup_exits_entered_lifespans():
+    calls: list[str] = []
+
+    @asynccontextmanager
+    async def failing(app):
+        raise RuntimeError("startup failed")
+        yield
+
+    manager = LifespanManager()
+    manager.add(_recording_lifespan("a", calls))
+    manager.add(failing)
+    manager.add(_recording_lifespan("b", calls))
+
+    with pytest.raises(RuntimeError, match="startup failed"):
+        async with manager(app=None):
+            pass
+
+    assert calls == ["enter a", "exit a"]
@@ -155,3 +155,45 @@ async def test_get_tools_wraps_mcp_tools():
     assert tools[0].name == "wrapped-tool"
     assert tools[0]._some_attr == "value"
     assert tools[1] is fake_other_tool
+
+
+def _listing_toolset(tool_filter=None):
+    toolset = KAgentMcpToolset.__new__(KAgentMcpToolset)
+    toolset.tool_filter = tool_filter
+    calls = []
+
+    async def mock_super_get_tools(self_arg, readonly_context=None):
+        calls.append(readonly_context)
+        tool = MagicMock()
+        tool.name = f"tool-{len(calls)}"
+        return [tool]
+
+    return toolset, calls, mock_super_get_tools
+
+
+@pytest.mark.asyncio
+async def test_get_tools_lists_once_per_invocation():
+    """Repeated get_tools calls within an invocation reuse the first listing."""
+    toolset, calls, mock_super_get_tools = _listing_toolset(tool_filter=["tool-1"])
+
+    with patch.object(McpToolset, "get_tools", mock_super_get_tools):
+        first = await toolset.get_tools(MagicMock(invocation_id="inv-1"))
+        second = await toolset.get_tools(MagicMock(invocation_id="inv-1"))
+        third = await toolset.get_tools(MagicMock(invocation_id="inv-2"))
+
+    assert len(calls) == 2
+    assert [t.name for t in first] == [t.name for t in second] == ["tool-1"]
+    assert first is not second
+    assert [t.name for t in third] == ["tool-2"]
+
+
+@pytest.mark.asyncio
+async def test_get_tools_not_cached_with_predicate_filter():
+    """A predicate filter can depend on the context, so every call lists tools."""
+    toolset, calls, mock_super_get_tools = _listing_toolset(tool_filter=lambda tool, ctx: True)
+
+    with patch.object(McpToolset, "get_tools", mock_super_get_tools):
+        await toolset.get_tools(MagicMock(invocation_id="inv-1"))
+        await toolset.get_tools(MagicMock(invocation_id="inv-1"))
+
+    assert len(calls) == 2
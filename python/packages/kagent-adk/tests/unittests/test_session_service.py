@@ -1,12 +1,15 @@
-"""Tests for KAgentSessionService."""
+"""Tests for KAgentSessionService and BoundedInMemorySessionService."""
 
+import asyncio
+import json
 from unittest.mock import AsyncMock, MagicMock
 
 import httpx
 import pytest
 from google.adk.events.event import Event, EventActions
+from google.adk.sessions import Session
 
-from kagent.adk._session_service import KAgentSessionService
+from kagent.adk._session_service import BoundedInMemorySessionService, KAgentSessionService
 
 
 @pytest.fixture
@@ -195,3 +198,106 @@ async def test_get_session_multiple_state_deltas_applied_once(make_event, sessio
     assert session is not None
     assert session.state.get("key_a") == "value_a"
     assert session.state.get("key_b") == "value_b"
+
+
+@pytest.mark.asyncio
+async def test_list_sessions(service):
+    """list_sessions maps each returned session onto an ADK Session for the app."""
+    svc = service({"data": [{"id": "s1", "user_id": "u1"}, {"id": "s2", "user_id": "u1"}]})
+
+    response = await svc.list_sessions(app_name="app", user_id="u1")
+
+    assert [(s.id, s.user_id, s.app_name, s.state, s.events) for s in response.sessions] == [
+        ("s1", "u1", "app", {}, []),
+        ("s2", "u1", "app", {}, []),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_append_event_posts_json_body(make_event):
+    """append_event sends the event id and serialized event as a JSON body."""
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(201)
+
+    client = httpx.AsyncClient(base_url="http://kagent", transport=httpx.MockTransport(handler))
+    svc = KAgentSessionService(client)
+    session = Session(id="s1", app_name="app", user_id="u1", state={}, events=[])
+    event = make_event(state_delta={"greeting": 'héllo "world"'})
+
+    await svc.append_event(session, event)
+
+    assert len(requests) == 1
+    request = requests[0]
+    assert request.url.path == "/api/sessions/s1/events"
+    assert request.headers["content-type"] == "application/json"
+    body = json.loads(request.content)
+    assert body["id"] == event.id
+    assert Event.model_validate_json(body["data"]) == event
+    assert session.state["greeting"] == 'héllo "world"'
+
+
+@pytest.mark.asyncio
+async def test_bounded_service_evicts_least_recently_used_session():
+    """Creating a session beyond max_sessions evicts the least recently used one."""
+    svc = BoundedInMemorySessionService(max_sessions=2)
+    await svc.create_session(app_name="app", user_id="u1", session_id="s1")
+    await svc.create_session(app_name="app", user_id="u1", session_id="s2")
+    # Touch s1 so that s2 becomes the least recently used session.
+    assert await svc.get_session(app_name="app", user_id="u1", session_id="s1") is not None
+
+    await svc.create_session(app_name="app", user_id="u1", session_id="s3")
+
+    assert await svc.get_session(app_name="app", user_id="u1", session_id="s2") is None
+    assert await svc.get_session(app_name="app", user_id="u1", session_id="s1") is not None
+    assert await svc.get_session(app_name="app", user_id="u1", session_id="s3") is not None
+
+
+@pytest.mark.asyncio
+async def test_bounded_service_evicts_expired_sessions(make_event):
+    """evict_expired drops sessions idle for longer than ttl_seconds."""
+    svc = BoundedInMemorySessionService(ttl_seconds=0)
+    session = await svc.create_session(app_name="app", user_id="u1", session_id="s1")
+    await svc.append_event(session, make_event())
+
+    assert svc.evict_expired() == 1
+    assert await svc.get_session(app_name="app", user_id="u1", session_id="s1") is None
+    assert svc.evict_expired() == 0
+
+
+@pytest.mark.asyncio
+async def test_bounded_service_keeps_recent_sessions(make_event):
+    """Sessions accessed within the TTL survive evict_expired."""
+    svc = BoundedInMemorySessionService(ttl_seconds=3600)
+    session = await svc.create_session(app_name="app", user_id="u1", session_id="s1")
+    await svc.append_event(session, make_event())
+
+    assert svc.evict_expired() == 0
+    stored = await svc.get_session(app_name="app", user_id="u1", session_id="s1")
+    assert stored is not None
+    assert len(stored.events) == 1
+
+
+@pytest.mark.asyncio
+async def test_bounded_service_delete_session_stops_tracking():
+    svc = BoundedInMemorySessionService(max_sessions=1)
+    await svc.create_session(app_name="app", user_id="u1", session_id="s1")
+    await svc.delete_session(app_name="app", user_id="u1", session_id="s1")
+
+    await svc.create_session(app_name="app", user_id="u1", session_id="s2")
+
+    assert await svc.get_session(app_name="app", user_id="u1", session_id="s2") is not None
+
+
+@pytest.mark.asyncio
+async def test_bounded_service_lifespan_stops_eviction_task():
+    """The eviction task has finished by the time the lifespan exits."""
+    svc = BoundedInMemorySessionService(eviction_interval_seconds=3600)
+    before = asyncio.all_tasks()
+
+    async with svc.lifespan()(None):
+        assert len(asyncio.all_tasks() - before) == 1
+
+    assert asyncio.all_tasks() - before == set()
@@ -1,7 +1,8 @@
 from ._config import KAgentConfig
+from ._endpoints import add_health_routes
 from ._logging import configure_logging
 from .tracing import configure as configure_tracing
 
 configure_logging()
 
-__all__ = ["KAgentConfig", "configure_tracing", "configure_logging"]
+__all__ = ["KAgentConfig", "add_health_routes", "configure_tracing", "configure_logging"]
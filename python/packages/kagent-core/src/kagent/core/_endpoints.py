@@ -0,0 +1,68 @@
+"""Health check and debugging endpoints shared by the kagent agent servers.
+
+The endpoints are raw ASGI callables: the readiness/liveness probes hit
+``/health`` every few seconds, so it only emits pre-encoded constants instead
+of going through Starlette's Request/Response objects.
+"""
+
+import faulthandler
+import tempfile
+from typing import IO, Awaitable
+
+from starlette.applications import Starlette
+from starlette.concurrency import run_in_threadpool
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+_PLAIN_TEXT_CONTENT_TYPE = (b"content-type", b"text/plain; charset=utf-8")
+_HEALTH_BODY = b"OK"
+_HEALTH_HEADERS = (_PLAIN_TEXT_CONTENT_TYPE, (b"content-length", b"%d" % len(_HEALTH_BODY)))
+_THREAD_DUMP_CHUNK_SIZE = 64 * 1024
+
+
+async def _send_plain_text(send: Send, body: bytes, headers: tuple[tuple[bytes, bytes], ...]) -> None:
+    # Hand out a fresh header list per response: ASGI middleware (e.g. the
+    # OpenTelemetry instrumentation) may append to it.
+    await send({"type": "http.response.start", "status": 200, "headers": list(headers)})
+    await send({"type": "http.response.body", "body": body})
+
+
+def _dump_threads(file: IO[bytes]) -> None:
+    faulthandler.dump_traceback(file=file, all_threads=True)
+    file.seek(0)
+
+
+async def health_check(scope: Scope, receive: Receive, send: Send) -> None:
+    await _send_plain_text(send, _HEALTH_BODY, _HEALTH_HEADERS)
+
+
+async def thread_dump(scope: Scope, receive: Receive, send: Send) -> None:
+    # faulthandler writes to a file descriptor, so dump into a temporary file
+    # and stream it back in chunks rather than reading it into memory at once.
+    with tempfile.TemporaryFile() as tmp:
+        await run_in_threadpool(_dump_threads, tmp)
+        await send({"type": "http.response.start", "status": 200, "headers": [_PLAIN_TEXT_CONTENT_TYPE]})
+        while chunk := await run_in_threadpool(tmp.read, _THREAD_DUMP_CHUNK_SIZE):
+            await send({"type": "http.response.body", "body": chunk, "more_body": True})
+        await send({"type": "http.response.body", "body": b""})
+
+
+class _ASGIEndpoint:
+    """Route endpoint that hands the request straight to a raw ASGI callable.
+
+    Starlette wraps plain functions in a Request/Response adapter; any other
+    callable is treated as an ASGI app and invoked as-is.
+    """
+
+    __slots__ = ("_app",)
+
+    def __init__(self, app: ASGIApp):
+        self._app = app
+
+    def __call__(self, scope: Scope, receive: Receive, send: Send) -> Awaitable[None]:
+        return self._app(scope, receive, send)
+
+
+def add_health_routes(app: Starlette) -> None:
+    """Registers the ``/health`` probe and the ``/thread_dump`` debugging endpoint."""
+    app.add_route("/health", methods=["GET"], route=_ASGIEndpoint(health_check))
+    app.add_route("/thread_dump", methods=["GET"], route=_ASGIEndpoint(thread_dump))
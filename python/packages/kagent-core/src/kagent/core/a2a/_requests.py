@@ -30,6 +30,10 @@ class KAgentUser(User):
 class KAgentRequestContextBuilder(SimpleRequestContextBuilder):
     """
     A request context builder that will be used to hack in the user_id for now.
+
+    The builder keeps no per-request state besides the task store it is
+    constructed with, so a single instance is shared by all requests handled
+    by an application.
     """
 
     def __init__(self, task_store: TaskStore):
@@ -11,10 +11,18 @@ logger = logging.getLogger(__name__)
 
 KAGENT_ATTRIBUTES_KEY = "kagent_trace_span_attributes"
 
+# Set once a KagentAttributesSpanProcessor exists; until then nothing reads
+# the attributes, so callers can skip building them.
+_processor_created = False
+
 
 class KagentAttributesSpanProcessor(SpanProcessor):
     """A SpanProcessor that adds kagent-specific attributes to all spans."""
 
+    def __init__(self) -> None:
+        global _processor_created
+        _processor_created = True
+
     def on_start(self, span: Span, parent_context: Optional[otel_context.Context] = None) -> None:
         """Called when a span is started. Adds kagent attributes if present in context."""
         try:
@@ -41,6 +49,15 @@ class KagentAttributesSpanProcessor(SpanProcessor):
         return True
 
 
+def kagent_span_attributes_enabled() -> bool:
+    """Whether kagent span attributes are consumed by a span processor.
+
+    Returns:
+        True once tracing has been configured with a KagentAttributesSpanProcessor
+    """
+    return _processor_created
+
+
 def set_kagent_span_attributes(attributes: dict) -> Token[otel_context.Context]:
     """Set kagent span attributes in the context.
     Args:
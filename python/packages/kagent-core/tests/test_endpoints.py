@@ -0,0 +1,55 @@
+"""Tests for the shared health check and debugging endpoints."""
+
+import pytest
+from starlette.applications import Starlette
+from starlette.testclient import TestClient
+
+from kagent.core import add_health_routes
+from kagent.core._endpoints import health_check
+
+
+@pytest.fixture
+def client() -> TestClient:
+    app = Starlette()
+    add_health_routes(app)
+    return TestClient(app)
+
+
+def test_health_check(client: TestClient):
+    response = client.get("/health")
+
+    assert response.status_code == 200
+    assert response.text == "OK"
+    assert response.headers["content-type"] == "text/plain; charset=utf-8"
+    assert response.headers["content-length"] == "2"
+
+
+@pytest.mark.asyncio
+async def test_health_check_headers_are_not_shared():
+    """Each response gets its own header list, so middleware appending to it cannot leak."""
+    sent_headers = []
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            message["headers"].append((b"x-extra", b"1"))
+            sent_headers.append(message["headers"])
+
+    await health_check({"type": "http"}, None, send)
+    await health_check({"type": "http"}, None, send)
+
+    assert sent_headers[0] is not sent_headers[1]
+    assert len(sent_headers[1]) == 3
+
+
+def test_health_check_rejects_other_methods(client: TestClient):
+    response = client.post("/health")
+
+    assert response.status_code == 405
+
+
+def test_thread_dump(client: TestClient):
+    response = client.get("/thread_dump")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "text/plain; charset=utf-8"
+    assert "Thread" in response.text
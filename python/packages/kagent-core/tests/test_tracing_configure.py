@@ -4,7 +4,7 @@ import pytest
 from opentelemetry.propagate import get_global_textmap
 from opentelemetry.trace import get_current_span
 
-from kagent.core.tracing import _utils
+from kagent.core.tracing import _span_processor, _utils
 
 
 def test_configure_tracing_logging_enabled_uses_event_logger_provider(monkeypatch):
@@ -120,3 +120,12 @@ def test_resolve_otlp_timeout_seconds_uses_milliseconds(monkeypatch, signal, env
         monkeypatch.setenv(key, value)
 
     assert _utils._resolve_otlp_timeout_seconds(signal) == expected
+
+
+def test_kagent_span_attributes_enabled_once_processor_exists(monkeypatch):
+    monkeypatch.setattr(_span_processor, "_processor_created", False)
+    assert not _span_processor.kagent_span_attributes_enabled()
+
+    _span_processor.KagentAttributesSpanProcessor()
+
+    assert _span_processor.kagent_span_attributes_enabled()
@@ -7,9 +7,8 @@ import httpx
 from a2a.server.apps import A2AStarletteApplication
 from a2a.server.request_handlers import DefaultRequestHandler
 from a2a.types import AgentCard
-from fastapi import FastAPI, Request
-from fastapi.responses import PlainTextResponse
-from kagent.core import KAgentConfig, configure_tracing
+from fastapi import FastAPI
+from kagent.core import KAgentConfig, add_health_routes, configure_tracing
 from kagent.core.a2a import (
     KAgentRequestContextBuilder,
     KAgentTaskStore,
@@ -24,19 +23,6 @@ from ._executor import CrewAIAgentExecutor, CrewAIAgentExecutorConfig
 logger = logging.getLogger(__name__)
 
 
-def def_health_check(request: Request) -> PlainTextResponse:
-    return PlainTextResponse("OK")
-
-
-def thread_dump(request: Request) -> PlainTextResponse:
-    import tempfile
-
-    with tempfile.TemporaryFile(mode="w+") as tmp:
-        faulthandler.dump_traceback(file=tmp, all_threads=True)
-        tmp.seek(0)
-        return PlainTextResponse(tmp.read())
-
-
 class KAgentApp:
     def __init__(
         self,
@@ -92,8 +78,7 @@ class KAgentApp:
             if tracing_enabled:
                 CrewAIInstrumentor().instrument()
 
-        app.add_route("/health", methods=["GET"], route=def_health_check)
-        app.add_route("/thread_dump", methods=["GET"], route=thread_dump)
+        add_health_routes(app)
         a2a_app.add_routes_to_app(app)
 
         return app
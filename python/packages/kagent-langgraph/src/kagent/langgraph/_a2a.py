@@ -11,9 +11,8 @@ import httpx
 from a2a.server.apps import A2AStarletteApplication
 from a2a.server.request_handlers import DefaultRequestHandler
 from a2a.types import AgentCard
-from fastapi import FastAPI, Request
-from fastapi.responses import PlainTextResponse
-from kagent.core import KAgentConfig, configure_tracing
+from fastapi import FastAPI
+from kagent.core import KAgentConfig, add_health_routes, configure_tracing
 from kagent.core.a2a import (
     KAgentRequestContextBuilder,
     KAgentTaskStore,
@@ -28,21 +27,6 @@ from ._executor import LangGraphAgentExecutor, LangGraphAgentExecutorConfig
 logger = logging.getLogger(__name__)
 
 
-def health_check(request: Request) -> PlainTextResponse:
-    """Health check endpoint."""
-    return PlainTextResponse("OK")
-
-
-def thread_dump(request: Request) -> PlainTextResponse:
-    """Thread dump endpoint for debugging."""
-    import tempfile
-
-    with tempfile.TemporaryFile(mode="w+") as tmp:
-        faulthandler.dump_traceback(file=tmp, all_threads=True)
-        tmp.seek(0)
-        return PlainTextResponse(tmp.read())
-
-
 class KAgentApp:
     """Main application class for LangGraph + KAgent integration.
 
@@ -132,8 +116,7 @@ class KAgentApp:
                 logger.exception("Failed to configure tracing")
 
         # Add health check and debugging routes
-        app.add_route("/health", methods=["GET"], route=health_check)
-        app.add_route("/thread_dump", methods=["GET"], route=thread_dump)
+        add_health_routes(app)
 
         # Add A2A routes
         a2a_app.add_routes_to_app(app)
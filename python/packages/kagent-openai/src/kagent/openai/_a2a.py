@@ -7,6 +7,7 @@ that integrate OpenAI Agents SDK with the A2A (Agent-to-Agent) protocol.
 from __future__ import annotations
 
 import faulthandler
+import functools
 import logging
 import os
 from collections.abc import Callable
@@ -17,9 +18,8 @@ from a2a.server.request_handlers import DefaultRequestHandler
 from a2a.server.tasks import InMemoryTaskStore
 from a2a.types import AgentCard
 from agents import Agent, set_default_openai_api, set_default_openai_client, set_tracing_disabled
-from fastapi import FastAPI, Request
-from fastapi.responses import PlainTextResponse
-from kagent.core import KAgentConfig, configure_tracing
+from fastapi import FastAPI
+from kagent.core import KAgentConfig, add_health_routes, configure_tracing
 from kagent.core.a2a import (
     KAgentRequestContextBuilder,
     KAgentTaskStore,
@@ -37,21 +37,6 @@ from ._session_service import KAgentSessionFactory
 logger = logging.getLogger(__name__)
 
 
-def health_check(request: Request) -> PlainTextResponse:
-    """Health check endpoint."""
-    return PlainTextResponse("OK")
-
-
-def thread_dump(request: Request) -> PlainTextResponse:
-    """Thread dump endpoint for debugging."""
-    import tempfile
-
-    with tempfile.TemporaryFile(mode="w+") as tmp:
-        faulthandler.dump_traceback(file=tmp, all_threads=True)
-        tmp.seek(0)
-        return PlainTextResponse(tmp.read())
-
-
 # Environment variables
 kagent_url_override = os.getenv("KAGENT_URL")
 sts_well_known_uri = os.getenv("STS_WELL_KNOWN_URI")
@@ -99,13 +84,14 @@ class KAgentApp:
             config: Optional executor configuration
         """
         self.agent = agent
+        self._is_agent_factory = callable(agent) and not isinstance(agent, Agent)
         self.agent_card = AgentCard.model_validate(agent_card)
         self.config = config
         self.executor_config = executor_config or OpenAIAgentExecutorConfig()
         self.tracing = tracing
 
-    def build(self) -> FastAPI:
-        """Build a production FastAPI application with KAgent integration.
+    def build(self, local: bool = False) -> FastAPI:
+        """Build a FastAPI application with KAgent integration.
 
         This creates an application that:
         - Uses KAgentSessionFactory for session management
@@ -113,38 +99,48 @@ class KAgentApp:
         - Implements A2A protocol handlers
         - Includes health check endpoints
 
+        With ``local=True`` the application runs without the KAgent backend:
+        it uses an InMemoryTaskStore, runs agents without session persistence
+        and skips tracing setup, which is useful for local development and
+        testing.
+
+        Args:
+            local: Build a local application that does not need the KAgent backend
+
         Returns:
             Configured FastAPI application
         """
         _configure_openai_client()
 
-        # Create HTTP client with KAgent backend
-        http_client = httpx.AsyncClient(
-            base_url=kagent_url_override or self.config.kagent_url,
-        )
-
-        # Create session factory
-        session_factory = KAgentSessionFactory(
-            client=http_client,
-            app_name=self.config.app_name,
-        )
+        task_store: InMemoryTaskStore | KAgentTaskStore
+        if local:
+            # No session persistence in local mode
+            session_factory = None
+            task_store = InMemoryTaskStore()
+        else:
+            # Create HTTP client with KAgent backend
+            http_client = httpx.AsyncClient(
+                base_url=kagent_url_override or self.config.kagent_url,
+            )
+            session_factory = KAgentSessionFactory(
+                client=http_client,
+                app_name=self.config.app_name,
+            ).create_session
+            task_store = KAgentTaskStore(http_client)
 
         # Create agent executor with session factory
         agent_executor = OpenAIAgentExecutor(
             agent=self.agent,
             app_name=self.config.app_name,
-            session_factory=session_factory.create_session,
+            session_factory=session_factory,
             config=self.executor_config,
         )
 
-        # Create KAgent task store
-        kagent_task_store = KAgentTaskStore(http_client)
-
         # Create request context builder and handler
-        request_context_builder = KAgentRequestContextBuilder(task_store=kagent_task_store)
+        request_context_builder = KAgentRequestContextBuilder(task_store=task_store)
         request_handler = DefaultRequestHandler(
             agent_executor=agent_executor,
-            task_store=kagent_task_store,
+            task_store=task_store,
             request_context_builder=request_context_builder,
         )
 
@@ -159,10 +155,10 @@ class KAgentApp:
         # Enable fault handler
         faulthandler.enable()
 
-        # Create FastAPI app with lifespan
+        # Create FastAPI app
         app = FastAPI()
 
-        if self.tracing:
+        if self.tracing and not local:
             try:
                 # Set OpenAI tracing disabled and set custom OTEL tracing to be enabled
                 logger.info("Configuring tracing for KAgent OpenAI app")
@@ -182,67 +178,15 @@ class KAgentApp:
                 logger.error(f"Failed to configure tracing: {e}")
 
         # Add health check endpoints
-        app.add_route("/health", methods=["GET"], route=health_check)
-        app.add_route("/thread_dump", methods=["GET"], route=thread_dump)
+        add_health_routes(app)
 
         # Add A2A routes
         a2a_app.add_routes_to_app(app)
 
         return app
 
-    def build_local(self) -> FastAPI:
-        """Build a local FastAPI application for testing without KAgent backend.
-
-        This creates an application that:
-        - Uses InMemoryTaskStore (no KAgent backend needed)
-        - Runs agents without session persistence
-        - Useful for local development and testing
-
-        Returns:
-            Configured FastAPI application for local use
-        """
-        _configure_openai_client()
-
-        # Create agent executor without session factory (no persistence)
-        agent_executor = OpenAIAgentExecutor(
-            agent=self.agent,
-            app_name=self.config.app_name,
-            session_factory=None,  # No session persistence in local mode
-            config=self.executor_config,
-        )
-        # Use in-memory task store
-        task_store = InMemoryTaskStore()
-
-        # Create request context builder and handler
-        request_context_builder = KAgentRequestContextBuilder(task_store=task_store)
-        request_handler = DefaultRequestHandler(
-            agent_executor=agent_executor,
-            task_store=task_store,
-            request_context_builder=request_context_builder,
-        )
-
-        # Create A2A FastAPI application
-        max_content_length = get_a2a_max_content_length()
-        a2a_app = A2AFastAPIApplication(
-            agent_card=self.agent_card,
-            http_handler=request_handler,
-            max_content_length=max_content_length,
-        )
-
-        # Enable fault handler
-        faulthandler.enable()
-
-        # Create FastAPI app
-        app = FastAPI()
-
-        # Add health check endpoints
-        app.add_route("/health", methods=["GET"], route=health_check)
-        app.add_route("/thread_dump", methods=["GET"], route=thread_dump)
-
-        # Add A2A routes
-        a2a_app.add_routes_to_app(app)
-
-        return app
+    # Local FastAPI application for testing without the KAgent backend.
+    build_local = functools.partialmethod(build, local=True)
 
     async def test(self, task: str) -> None:
         """Test the agent with a simple task.
@@ -253,7 +197,7 @@ class KAgentApp:
         from agents.run import Runner
 
         # Resolve agent
-        if callable(self.agent):
+        if self._is_agent_factory:
             agent = self.agent()
         else:
             agent = self.agent
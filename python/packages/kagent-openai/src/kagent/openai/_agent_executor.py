@@ -89,13 +89,14 @@ class OpenAIAgentExecutor(AgentExecutor):
         """
         super().__init__()
         self._agent = agent
+        self._is_agent_factory = callable(agent) and not isinstance(agent, Agent)
         self.app_name = app_name
         self._session_factory = session_factory
         self._config = config or OpenAIAgentExecutorConfig()
 
     def _resolve_agent(self) -> Agent:
         """Resolve the agent, handling both instances and factory functions."""
-        if callable(self._agent):
+        if self._is_agent_factory:
             # Call the factory to get the agent
             return self._agent()
         return self._agent
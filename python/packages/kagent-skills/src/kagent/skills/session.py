@@ -2,12 +2,15 @@
 
 import logging
 import tempfile
+import threading
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
 # Cache of initialized session paths to avoid re-creating symlinks
 _session_path_cache: dict[str, Path] = {}
+# Serializes first-time initialization; cache hits are read without locking
+_session_path_lock = threading.Lock()
 
 
 def initialize_session_path(session_id: str, skills_directory: str) -> Path:
@@ -29,9 +32,19 @@ def initialize_session_path(session_id: str, skills_directory: str) -> Path:
         The resolved path to the session's root directory.
     """
     # Return cached path if already initialized
-    if session_id in _session_path_cache:
-        return _session_path_cache[session_id]
+    cached = _session_path_cache.get(session_id)
+    if cached is not None:
+        return cached
 
+    with _session_path_lock:
+        # Another thread may have initialized the session while we waited
+        cached = _session_path_cache.get(session_id)
+        if cached is not None:
+            return cached
+        return _create_session_path(session_id, skills_directory)
+
+
+def _create_session_path(session_id: str, skills_directory: str) -> Path:
     # Initialize new session path
     base_path = Path(tempfile.gettempdir()) / "kagent"
     session_path = base_path / session_id
@@ -43,12 +56,12 @@ def initialize_session_path(session_id: str, skills_directory: str) -> Path:
     # Create symlink to skills directory
     skills_mount = Path(skills_directory)
     skills_link = session_path / "skills"
-    if skills_mount.exists() and not skills_link.exists():
+    if skills_mount.exists():
         try:
             skills_link.symlink_to(skills_mount)
             logger.debug(f"Created symlink: {skills_link} -> {skills_mount}")
         except FileExistsError:
-            # Symlink already exists (race condition from concurrent session setup)
+            # Symlink already exists (session set up before, or by another process)
             pass
         except Exception as e:
             # Log but don't fail - skills can still be accessed via absolute path
@@ -73,8 +86,9 @@ def get_session_path(session_id: str) -> Path:
         The resolved path to the session's root directory.
     """
     # Return cached path if already initialized
-    if session_id in _session_path_cache:
-        return _session_path_cache[session_id]
+    cached = _session_path_cache.get(session_id)
+    if cached is not None:
+        return cached
 
     # Fallback: auto-initialize with default /skills
     logger.warning(
@@ -381,3 +381,28 @@ async def test_execute_command_strips_secret_env_vars(tmp_path):
     assert "GOOGLE_APPLICATION_CREDENTIALS" not in env
     assert "AWS_ACCESS_KEY_ID" not in env
     assert env["HOME"] == "/home/user"
+
+
+def test_initialize_session_path_creates_directories_once(tmp_path, monkeypatch):
+    """Concurrent first calls for a session share a single initialization."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    from kagent.skills import session
+
+    monkeypatch.setattr(session.tempfile, "gettempdir", lambda: str(tmp_path))
+    monkeypatch.setattr(session, "_session_path_cache", {})
+    created = []
+    create_session_path = session._create_session_path
+
+    def counting_create(session_id, skills_directory):
+        created.append(session_id)
+        return create_session_path(session_id, skills_directory)
+
+    monkeypatch.setattr(session, "_create_session_path", counting_create)
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        paths = list(pool.map(lambda _: session.initialize_session_path("s1", str(tmp_path / "skills")), range(16)))
+
+    assert created == ["s1"]
+    assert set(paths) == {(tmp_path / "kagent" / "s1").resolve()}
+    assert (tmp_path / "kagent" / "s1" / "uploads").is_dir()